@@ -18,16 +18,20 @@ from rich.table import Table
 from ps3toolbox.covers.sync import sync_covers_command
 from ps3toolbox.ps2.decrypt import decrypt_ps2_iso
 from ps3toolbox.ps2.decrypt import extract_metadata
+from ps3toolbox.ps2.encrypt import DEFAULT_WORKERS
 from ps3toolbox.ps2.encrypt import encrypt_ps2_iso
 from ps3toolbox.utils.disc_detect import detect_disc_number
 from ps3toolbox.utils.progress import ConsoleProgress
 from ps3toolbox.utils.validation import check_disk_space
 from ps3toolbox.utils.validation import validate_input_file
+from ps3toolbox.utils.validation import validate_input_files
 from ps3toolbox.utils.validation import validate_output_path
 
 
 console = Console()
 
+ISO_EXTENSIONS = frozenset({".iso"})
+
 
 @click.group()
 @click.version_option(version="0.1.0")
@@ -44,6 +48,13 @@ def cli() -> None:
 @click.option("--disc-num", type=click.IntRange(1, 9), default=1, help="Disc number for multi-disc games (1-9)")
 @click.option("--overwrite/--no-overwrite", default=False, help="Overwrite existing output file")
 @click.option("--remove-source/--keep-source", default=False, help="Remove source ISO after successful encryption")
+@click.option(
+    "--workers",
+    type=click.IntRange(min=1),
+    default=DEFAULT_WORKERS,
+    show_default=True,
+    help="Number of processes encrypting in parallel",
+)
 def encrypt(
     input_path: Path,
     output_path: Path | None,
@@ -52,13 +63,14 @@ def encrypt(
     disc_num: int,
     overwrite: bool,
     remove_source: bool,
+    workers: int,
 ) -> None:
     """Encrypt PS2 ISO to .BIN.ENC format."""
     if output_path is None:
         output_path = input_path.with_suffix(".bin.enc")
 
     try:
-        validate_input_file(input_path, [".iso"])
+        validate_input_file(input_path, ISO_EXTENSIONS)
         validate_output_path(output_path, overwrite)
         check_disk_space(output_path, input_path.stat().st_size * 2)
 
@@ -71,7 +83,9 @@ def encrypt(
             mode=mode,
             content_id=content_id,
             disc_num=disc_num,
+            use_temp=not remove_source,
             progress_callback=progress.update,
+            workers=workers,
         )
 
         progress.finish()
@@ -117,7 +131,7 @@ def _encrypt_single_iso(args):
     """Worker function for parallel encryption.
 
     Args:
-        args: Tuple of (iso_file, output_file, mode, disc_num_override)
+        args: Tuple of (iso_file, output_file, mode, disc_num_override, remove_source)
 
     Returns:
         Tuple of (iso_file, success, error_message, should_remove)
@@ -130,7 +144,14 @@ def _encrypt_single_iso(args):
 
         detected_disc = disc_num_override if disc_num_override else detect_disc_number(iso_file.name)
 
-        encrypt_ps2_iso(iso_file, output_file, mode=mode, disc_num=detected_disc, progress_callback=None)
+        encrypt_ps2_iso(
+            iso_file,
+            output_file,
+            mode=mode,
+            disc_num=detected_disc,
+            use_temp=not remove_source,
+            progress_callback=None,
+        )
 
         return (iso_file, "success", detected_disc, remove_source)
 
@@ -173,7 +194,8 @@ def batch_encrypt(
     Use --workers to control parallel processing (default: CPU count).
     """
     glob_pattern = f"**/{pattern}" if recursive else pattern
-    iso_files = list(directory.glob(glob_pattern))
+    # The pattern decides which names count as ISOs; only drop matches that are not files
+    iso_files = validate_input_files(directory.glob(glob_pattern), ())
 
     if not iso_files:
         console.print(f"[yellow]No ISO files found matching pattern: {pattern}[/yellow]")
@@ -295,6 +317,12 @@ def covers() -> None:
 )
 @click.option("--full-output", is_flag=True, default=False, help="Show all games in dry-run (not just first 50)")
 @click.option("--limit", type=int, default=None, help="Limit to first N games (useful for testing)")
+@click.option(
+    "--scan-cache",
+    type=click.Path(dir_okay=False, path_type=Path),
+    default=None,
+    help="SQLite file caching resolved serials between runs (skips matching for unchanged games)",
+)
 def sync(
     path: str,
     database: Path | None,
@@ -304,6 +332,7 @@ def sync(
     platform: str | None,
     full_output: bool,
     limit: int | None,
+    scan_cache: Path | None,
 ) -> None:
     """
     Sync cover art for PS1/PS2/ROM games.
@@ -329,6 +358,7 @@ def sync(
                 platform_filter=platform.upper() if platform else None,
                 full_output=full_output,
                 limit=limit,
+                scan_cache_path=scan_cache,
             )
         )
     except KeyboardInterrupt:
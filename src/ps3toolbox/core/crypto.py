@@ -1,5 +1,6 @@
 """Low-level cryptographic operations."""
 
+from functools import lru_cache
 from hashlib import sha1
 
 from cryptography.hazmat.backends import default_backend
@@ -8,6 +9,10 @@ from cryptography.hazmat.primitives.ciphers import algorithms
 from cryptography.hazmat.primitives.ciphers import modes
 
 
+# Extra room update_into() insists on in its output buffer (one AES block minus a byte)
+CBC_INTO_SLACK = 15
+
+
 def aes128_cbc_encrypt(key: bytes, iv: bytes, data: bytes) -> bytes:
     """Encrypt data using AES-128-CBC."""
     cipher = Cipher(algorithms.AES(key), modes.CBC(iv), backend=default_backend())
@@ -15,6 +20,18 @@ def aes128_cbc_encrypt(key: bytes, iv: bytes, data: bytes) -> bytes:
     return encryptor.update(data) + encryptor.finalize()
 
 
+def aes128_cbc_encrypt_into(key: bytes, iv: bytes, src: memoryview, dst: memoryview | bytearray) -> int:
+    """Encrypt src with AES-128-CBC straight into dst, return the number of bytes written.
+
+    src must be block-aligned. dst needs CBC_INTO_SLACK spare bytes past len(src),
+    which cryptography requires of update_into() buffers.
+    """
+    encryptor = Cipher(algorithms.AES(key), modes.CBC(iv), backend=default_backend()).encryptor()
+    written = encryptor.update_into(src, dst)
+    encryptor.finalize()
+    return written
+
+
 def aes128_cbc_decrypt(key: bytes, iv: bytes, data: bytes) -> bytes:
     """Decrypt data using AES-128-CBC."""
     cipher = Cipher(algorithms.AES(key), modes.CBC(iv), backend=default_backend())
@@ -39,42 +56,46 @@ def calculate_sha1(data: bytes) -> bytes:
 
 def calculate_omac(data: bytes, key: bytes) -> bytes:
     """Calculate OMAC (CMAC) for NPD authentication."""
+    k1, k2 = _omac_subkeys(key)
 
-    running = bytearray(16)
-
-    cipher = Cipher(algorithms.AES(key), modes.ECB(), backend=default_backend())
-    encryptor = cipher.encryptor()
-    worthless = bytearray(encryptor.update(bytes(running)) + encryptor.finalize())
-    _rol1(worthless)
-
-    offset = 0
-    if len(data) > 16:
-        for offset in range(0, len(data) - 16, 16):
-            hash_block = bytearray(16)
-            for j in range(16):
-                hash_block[j] = running[j] ^ data[offset + j]
-
-            cipher = Cipher(algorithms.AES(key), modes.ECB(), backend=default_backend())
-            encryptor = cipher.encryptor()
-            running = bytearray(encryptor.update(bytes(hash_block)) + encryptor.finalize())
+    # Blocks chained before the final one; the final block re-reads the last chained offset
+    chained = len(range(0, len(data) - 16, 16))
+    offset = (chained - 1) * 16 if chained else 0
 
     overrun = len(data) % 16
     if overrun == 0:
         overrun = 16
 
-    hash_block = bytearray(16)
-    hash_block[:overrun] = data[offset : offset + overrun]
-
+    last = data[offset : offset + overrun]
     if overrun != 16:
-        hash_block[overrun] = 0x80
-        _rol1(worthless)
-
-    for j in range(16):
-        hash_block[j] ^= running[j] ^ worthless[j]
-
-    cipher = Cipher(algorithms.AES(key), modes.ECB(), backend=default_backend())
-    encryptor = cipher.encryptor()
-    return encryptor.update(bytes(hash_block)) + encryptor.finalize()
+        last = last + b"\x80" + bytes(15 - overrun)
+        subkey = k2
+    else:
+        subkey = k1
+
+    # CBC with a zero IV is the OMAC chain; feeding the masked final block through it yields the tag
+    encryptor = _omac_cipher(key).encryptor()
+    encryptor.update(data[: chained * 16])
+    tag = encryptor.update((int.from_bytes(last, "big") ^ int.from_bytes(subkey, "big")).to_bytes(16, "big"))
+    encryptor.finalize()
+    return tag
+
+
+@lru_cache(maxsize=16)
+def _omac_cipher(key: bytes) -> Cipher:
+    """AES-CBC cipher with a zero IV, built once per OMAC key."""
+    return Cipher(algorithms.AES(key), modes.CBC(bytes(16)), backend=default_backend())
+
+
+@lru_cache(maxsize=16)
+def _omac_subkeys(key: bytes) -> tuple[bytes, bytes]:
+    """Derive the OMAC subkeys K1/K2 for key."""
+    encryptor = Cipher(algorithms.AES(key), modes.ECB(), backend=default_backend()).encryptor()
+    subkey = bytearray(encryptor.update(bytes(16)) + encryptor.finalize())
+    _rol1(subkey)
+    k1 = bytes(subkey)
+    _rol1(subkey)
+    return k1, bytes(subkey)
 
 
 def _rol1(data: bytearray) -> None:
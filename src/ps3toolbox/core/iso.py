@@ -1,5 +1,6 @@
 """ISO validation and preparation utilities."""
 
+import os
 from pathlib import Path
 
 from ps3toolbox.utils.errors import InvalidISOError
@@ -39,7 +40,7 @@ def pad_iso_to_boundary(iso_path: Path, boundary: int = 0x4000) -> int:
     padding_needed = (boundary - (current_size % boundary)) % boundary
 
     if padding_needed > 0:
-        with open(iso_path, "ab") as f:
-            f.write(b"\x00" * padding_needed)
+        # Extending the file reads back as zeros and lets the filesystem leave a hole
+        os.truncate(iso_path, current_size + padding_needed)
 
     return padding_needed
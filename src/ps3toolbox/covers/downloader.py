@@ -1,11 +1,14 @@
 """Multi-source cover downloader with fallback strategies."""
 
 import asyncio
+import random
 import re
+from collections import defaultdict
 from dataclasses import dataclass
 from io import BytesIO
 from typing import cast
 from urllib.parse import quote
+from urllib.parse import urlparse
 
 import aiohttp
 from PIL import Image
@@ -106,6 +109,27 @@ COVER_SOURCES = {
     ],
 }
 
+# Connection reuse for the cover hosts (seconds)
+DNS_CACHE_TTL = 300
+KEEPALIVE_TIMEOUT = 60
+
+# Requests in flight per host, so one slow host cannot take every download slot
+HOST_CONCURRENCY = 4
+# Retries for 429/5xx responses, backing off from RETRY_BACKOFF seconds (Retry-After capped at MAX_RETRY_AFTER)
+MAX_RETRIES = 3
+RETRY_BACKOFF = 0.25
+MAX_RETRY_AFTER = 30.0
+
+
+def _retry_delay(resp: aiohttp.ClientResponse, attempt: int) -> float:
+    """Seconds to wait before retrying a throttled or failed request."""
+    if resp.status == 429:
+        try:
+            return min(float(resp.headers.get("Retry-After", "")), MAX_RETRY_AFTER)
+        except ValueError:
+            pass
+    return RETRY_BACKOFF * 2**attempt + random.uniform(0, RETRY_BACKOFF)
+
 
 def clean_name_for_matching(name: str) -> str:
     """Clean game name for fuzzy matching."""
@@ -149,6 +173,9 @@ class CoverDownloader:
         self.max_concurrent = max_concurrent
         self.session: aiohttp.ClientSession | None = None
         self._semaphore = asyncio.Semaphore(max_concurrent)
+        self._host_semaphores: defaultdict[str, asyncio.Semaphore] = defaultdict(
+            lambda: asyncio.Semaphore(HOST_CONCURRENCY)
+        )
         self._cover_cache: dict[str, list[str]] = {}  # platform -> list of available covers
 
     async def __aenter__(self):
@@ -159,9 +186,15 @@ class CoverDownloader:
         await self.close()
 
     async def start(self):
-        """Start HTTP session."""
+        """Start HTTP session (one per downloader, so connections are kept alive across covers)."""
         if self.session is None:
-            self.session = aiohttp.ClientSession(headers={"User-Agent": "ps3toolbox/0.1.0"})
+            connector = aiohttp.TCPConnector(
+                limit=self.max_concurrent,
+                limit_per_host=self.max_concurrent,
+                ttl_dns_cache=DNS_CACHE_TTL,
+                keepalive_timeout=KEEPALIVE_TIMEOUT,
+            )
+            self.session = aiohttp.ClientSession(connector=connector, headers={"User-Agent": "ps3toolbox/0.1.0"})
 
     async def close(self):
         """Close HTTP session."""
@@ -317,45 +350,47 @@ class CoverDownloader:
         clean_name = clean_name_for_matching(game_name)
 
         async with self._semaphore:
-            # Try platform-specific sources if available
+            # Build URLs for the platform-specific sources, skipping those needing a serial we don't have
+            candidates: list[tuple[CoverSource, str]] = []
             for source in sources:
-                # Skip sources that require serial if we don't have one
-                if source.requires_serial and not serial:
-                    continue
-
-                # Build URL
                 if source.requires_serial:
-                    url = source.url_template.format(serial=serial)
-                    lookup_name = None
+                    if serial:
+                        candidates.append((source, source.url_template.format(serial=serial)))
                 else:
-                    # Try exact match first
-                    url = source.url_template.format(name=quote(clean_name))
-                    lookup_name = clean_name
+                    candidates.append((source, source.url_template.format(name=quote(clean_name))))
 
-                # Try to download with exact name
-                result = await self._download_from_url(url, resize)
-                if result:
-                    return result, source.name, url
-
-                # If LibRetro and exact match failed, try fuzzy matching
-                if source.name == "libretro" and lookup_name:
-                    available_covers = await self._fetch_available_covers(platform)
-                    if available_covers:
-                        # Find best match
-                        best_match = None
-                        best_score = 0.6  # Minimum threshold
-
-                        for cover_name in available_covers:
-                            score = fuzzy_match_score(clean_name, cover_name)
-                            if score > best_score:
-                                best_score = score
-                                best_match = cover_name
-
-                        if best_match:
-                            fuzzy_url = source.url_template.format(name=quote(best_match))
-                            result = await self._download_from_url(fuzzy_url, resize)
-                            if result:
-                                return result, f"{source.name} (fuzzy: {best_score:.0%})", fuzzy_url
+            # Fetch every source at once but take results in priority order,
+            # so misses on preferred sources cost max(latency) instead of the sum
+            tasks = [asyncio.create_task(self._download_from_url(url, resize)) for _, url in candidates]
+            try:
+                for (source, url), task in zip(candidates, tasks, strict=True):
+                    result = await task
+                    if result:
+                        return result, source.name, url
+            finally:
+                for task in tasks:
+                    task.cancel()
+
+            # If LibRetro exact match failed, try fuzzy matching
+            libretro = next((source for source, _ in candidates if source.name == "libretro"), None)
+            if libretro and not libretro.requires_serial:
+                available_covers = await self._fetch_available_covers(platform)
+                if available_covers:
+                    # Find best match
+                    best_match = None
+                    best_score = 0.6  # Minimum threshold
+
+                    for cover_name in available_covers:
+                        score = fuzzy_match_score(clean_name, cover_name)
+                        if score > best_score:
+                            best_score = score
+                            best_match = cover_name
+
+                    if best_match:
+                        fuzzy_url = libretro.url_template.format(name=quote(best_match))
+                        result = await self._download_from_url(fuzzy_url, resize)
+                        if result:
+                            return result, f"{libretro.name} (fuzzy: {best_score:.0%})", fuzzy_url
 
             # Final fallback: web image search
             web_urls = await self._search_web_for_cover(clean_name, platform)
@@ -373,20 +408,37 @@ class CoverDownloader:
     ) -> bytes | None:
         """Download and optionally resize image from URL."""
         try:
-            async with self.session.get(url, timeout=aiohttp.ClientTimeout(total=30)) as resp:
-                if resp.status == 200:
-                    data = await resp.read()
-
-                    # Resize if requested
-                    if resize:
-                        data = await self._resize_image(data, resize)
+            data = await self._fetch(url)
+            if data is not None:
+                # Resize if requested
+                if resize:
+                    data = await self._resize_image(data, resize)
 
-                    return data
+                return data
         except Exception:
             pass
 
         return None
 
+    async def _fetch(self, url: str) -> bytes | None:
+        """GET url within its host's concurrency limit, retrying 429/5xx; return the body on 200."""
+        host_semaphore = self._host_semaphores[urlparse(url).netloc]
+
+        for attempt in range(MAX_RETRIES + 1):
+            async with host_semaphore:
+                async with self.session.get(url, timeout=aiohttp.ClientTimeout(total=30)) as resp:
+                    if resp.status == 200:
+                        return await resp.read()
+
+                    if attempt == MAX_RETRIES or (resp.status != 429 and resp.status < 500):
+                        return None
+                    delay = _retry_delay(resp, attempt)
+
+            # Back off without holding the host slot
+            await asyncio.sleep(delay)
+
+        return None
+
     async def _resize_image(self, data: bytes, size: tuple[int, int]) -> bytes:
         """Resize image to target size while maintaining aspect ratio."""
 
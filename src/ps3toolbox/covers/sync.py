@@ -13,6 +13,7 @@ from ps3toolbox.games import GameOrganizer
 from ps3toolbox.games import GameScanner
 from ps3toolbox.games import OrganizeAction
 from ps3toolbox.games import RomDatabase
+from ps3toolbox.games import ScanCache
 from ps3toolbox.games import SerialResolver
 from ps3toolbox.utils.fs import FilesystemProvider
 from ps3toolbox.utils.fs import FTPFilesystem
@@ -57,6 +58,7 @@ class CoverSync:
         console: Console,
         dry_run: bool = False,
         full_output: bool = False,
+        scan_cache: ScanCache | None = None,
     ):
         self.fs = fs
         self.resolver = resolver
@@ -65,6 +67,7 @@ class CoverSync:
         self.console = console
         self.dry_run = dry_run
         self.full_output = full_output
+        self.scan_cache = scan_cache
         self.scanner = GameScanner(fs)
 
     async def sync_covers(
@@ -123,8 +126,7 @@ class CoverSync:
 
         # Resolve serials in parallel
         self.console.print(f"[dim]Resolving serials for {len(games_to_process)} games...[/dim]")
-        serial_tasks = [self.resolver.resolve(game.name, game.platform, use_fuzzy=True) for game in games_to_process]
-        serial_results = await asyncio.gather(*serial_tasks, return_exceptions=True)
+        serial_results = await self._resolve_serials(games_to_process)
 
         # In dry-run mode, search for covers in parallel
         cover_results = []
@@ -141,6 +143,7 @@ class CoverSync:
             cover_results = await asyncio.gather(*cover_tasks, return_exceptions=True)
 
         # Build actions
+        serials: dict[str, str | None] = {}
         for i, game in enumerate(games_to_process):
             serial_result = serial_results[i]
             if isinstance(serial_result, Exception):
@@ -150,6 +153,7 @@ class CoverSync:
                 serial_tuple = cast(tuple[str, str] | None, serial_result)
                 serial = serial_tuple[0] if serial_tuple else None
                 method = serial_tuple[1] if serial_tuple else "none"
+            serials[game.path] = serial
 
             # Get cover info
             cover_source = None
@@ -186,18 +190,11 @@ class CoverSync:
         download_tasks = []
         for action in actions:
             if action.action_type == "download":
-                serial_result = await self.resolver.resolve(
-                    action.game.name,
-                    action.game.platform,
-                    use_fuzzy=True,
-                )
-                serial = serial_result[0] if serial_result else None
-
                 download_tasks.append(
                     (
                         action,
                         action.game.platform,
-                        serial,
+                        serials[action.game.path],
                         action.game.name,
                     )
                 )
@@ -295,6 +292,26 @@ class CoverSync:
 
         return stats
 
+    async def _resolve_serials(self, games: list[GameFile]) -> list[tuple[str, str] | None | BaseException]:
+        """Resolve serials in parallel, reusing cached results for unchanged games."""
+        cached = self.scan_cache.lookup(games) if self.scan_cache else {}
+        pending = [game for game in games if game.path not in cached]
+
+        resolved = await asyncio.gather(
+            *(self.resolver.resolve(game.name, game.platform, use_fuzzy=True) for game in pending),
+            return_exceptions=True,
+        )
+        results = dict(zip((game.path for game in pending), resolved, strict=True))
+
+        if self.scan_cache:
+            self.scan_cache.store(
+                (game, cast(tuple[str, str], result))
+                for game, result in zip(pending, resolved, strict=True)
+                if result and not isinstance(result, BaseException)
+            )
+
+        return [cached[game.path] if game.path in cached else results[game.path] for game in games]
+
     def _display_plan(self, actions: list[SyncAction], stats: SyncStats):
         """Display dry-run plan in a formatted table."""
         table = Table(title="Cover Sync Plan (DRY RUN)", expand=True)
@@ -356,6 +373,7 @@ async def sync_covers_command(
     platform_filter: str | None = None,
     full_output: bool = False,
     limit: int | None = None,
+    scan_cache_path: Path | None = None,
 ):
     """Main entry point for cover sync command."""
     console = Console()
@@ -374,10 +392,11 @@ async def sync_covers_command(
                 db = RomDatabase()
                 db.load_from_tsv(db_file)
                 resolver.add_database(platform, db)
-                console.print(f"  Loaded {len(db.entries)} entries for {platform}")
+                console.print(f"  Loaded {len(db)} entries for {platform}")
 
     # Create components
     organizer = GameOrganizer(fs, dry_run=dry_run)
+    scan_cache = ScanCache(scan_cache_path) if scan_cache_path else None
 
     async with CoverDownloader(max_concurrent=10) as downloader:
         # Connect to FTP if needed
@@ -393,6 +412,7 @@ async def sync_covers_command(
                 console=console,
                 dry_run=dry_run,
                 full_output=full_output,
+                scan_cache=scan_cache,
             )
 
             await sync.sync_covers(
@@ -406,3 +426,5 @@ async def sync_covers_command(
         finally:
             if isinstance(fs, FTPFilesystem):
                 await fs.disconnect()
+            if scan_cache:
+                scan_cache.close()
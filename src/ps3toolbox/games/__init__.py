@@ -4,6 +4,7 @@ from .metadata import RomDatabase
 from .metadata import SerialResolver
 from .organizer import GameOrganizer
 from .organizer import OrganizeAction
+from .scan_cache import ScanCache
 from .scanner import GameFile
 from .scanner import GameScanner
 
@@ -13,6 +14,7 @@ __all__ = [
     "RomDatabase",
     "GameScanner",
     "GameFile",
+    "ScanCache",
     "GameOrganizer",
     "OrganizeAction",
 ]
@@ -1,18 +1,41 @@
 """Serial number resolver with fuzzy matching against ROM databases."""
 
 import csv
+import hashlib
+import heapq
+import json
+import os
 import re
+import sys
+import tempfile
+from collections import Counter
+from collections import OrderedDict
+from contextlib import suppress
+from functools import lru_cache
 from pathlib import Path
 
-from thefuzz import fuzz
+from rapidfuzz import fuzz
+from rapidfuzz import process
 
 
+_SERIAL = r"[A-Z]{4}[-_]\d{3}[.\d]{2,3}"
+
 SERIAL_PATTERNS = {
-    "parentheses": re.compile(r"\(([A-Z]{4}[-_]\d{3}[.\d]{2,3})\)"),
-    "brackets": re.compile(r"\[([A-Z]{4}[-_]\d{3}[.\d]{2,3})\]"),
-    "standalone": re.compile(r"\b([A-Z]{4}[-_]\d{3}[.\d]{2,3})\b"),
+    "parentheses": re.compile(rf"\(({_SERIAL})\)"),
+    "brackets": re.compile(rf"\[({_SERIAL})\]"),
+    "standalone": re.compile(rf"\b({_SERIAL})\b"),
 }
 
+# All serial formats in one pass; group 1/2/3 = parenthesized/bracketed/bare, preferred in that order
+_SERIAL_RE = re.compile(rf"\(({_SERIAL})\)|\[({_SERIAL})\]|\b({_SERIAL})\b")
+
+# clean_game_name strip patterns
+_PAREN_RE = re.compile(r"\([^)]*\)")
+_BRACKET_RE = re.compile(r"\[[^\]]*\]")
+_DISC_RE = re.compile(r"\bDisc\s+\d+\b", re.IGNORECASE)
+_CD_RE = re.compile(r"\bCD\s+\d+\b", re.IGNORECASE)
+_SPACES_RE = re.compile(r"\s+")
+
 REGION_PATTERNS = {
     "USA": re.compile(r"\((?:USA|US)\)", re.IGNORECASE),
     "Europe": re.compile(r"\((?:Europe|EUR|PAL)\)", re.IGNORECASE),
@@ -22,6 +45,30 @@ REGION_PATTERNS = {
 }
 
 
+# How many entries with the closest trigram sets get fuzzy scored per lookup
+FUZZY_CANDIDATES = 100
+
+# Parsed TSV columns cached as JSON in the user's cache folder; bump the version when the layout changes
+CACHE_VERSION = 2
+
+# Columns stored in the cache, in RomDatabase attribute order
+_CACHE_COLUMNS = ("names", "clean_names", "regions", "serials", "platforms")
+
+# Filename parsers are pure and see the same names repeatedly during a scan
+NAME_CACHE_SIZE = 65536
+
+
+def _cache_dir() -> Path:
+    """Per-user cache folder, honouring XDG_CACHE_HOME."""
+    return Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache") / "ps3toolbox"
+
+
+def _trigrams(text: str) -> set[str]:
+    """Character trigrams of text, padded so word edges count."""
+    padded = f" {text} "
+    return {padded[i : i + 3] for i in range(len(padded) - 2)}
+
+
 def normalize_serial(serial: str) -> str:
     """Normalize serial to standard format: SLUS-12345."""
     serial = serial.upper()
@@ -30,6 +77,7 @@ def normalize_serial(serial: str) -> str:
     return serial
 
 
+@lru_cache(maxsize=NAME_CACHE_SIZE)
 def extract_serial_from_filename(filename: str) -> str | None:
     """
     Extract serial from filename using various patterns.
@@ -39,12 +87,16 @@ def extract_serial_from_filename(filename: str) -> str | None:
         "Final Fantasy VII [SLUS_007.00].bin" → "SLUS-00700"
         "Crash Bandicoot (USA).bin" → None
     """
-    for _pattern_name, pattern in SERIAL_PATTERNS.items():
-        match = pattern.search(filename)
-        if match:
-            return normalize_serial(match.group(1))
-
-    return None
+    best = None
+    for match in _SERIAL_RE.finditer(filename):
+        if best is None or match.lastindex < best.lastindex:
+            best = match
+            if best.lastindex == 1:
+                break
+
+    if best is None:
+        return None
+    return normalize_serial(best[best.lastindex])
 
 
 def extract_region_from_filename(filename: str) -> str | None:
@@ -62,6 +114,7 @@ def extract_region_from_filename(filename: str) -> str | None:
     return None
 
 
+@lru_cache(maxsize=NAME_CACHE_SIZE)
 def clean_game_name(filename: str) -> str:
     """
     Clean game name from filename by removing metadata.
@@ -72,20 +125,21 @@ def clean_game_name(filename: str) -> str:
     """
     name = Path(filename).stem
 
-    # Remove serial patterns
-    for pattern in SERIAL_PATTERNS.values():
-        name = pattern.sub("", name)
+    # Remove serial patterns (any of them matching implies a bare serial, so one search rules them all out)
+    if _SERIAL_RE.search(name):
+        for pattern in SERIAL_PATTERNS.values():
+            name = pattern.sub("", name)
 
     # Remove region patterns
-    name = re.sub(r"\([^)]*\)", "", name)
-    name = re.sub(r"\[[^\]]*\]", "", name)
+    name = _PAREN_RE.sub("", name)
+    name = _BRACKET_RE.sub("", name)
 
     # Remove disc info
-    name = re.sub(r"\bDisc\s+\d+\b", "", name, flags=re.IGNORECASE)
-    name = re.sub(r"\bCD\s+\d+\b", "", name, flags=re.IGNORECASE)
+    name = _DISC_RE.sub("", name)
+    name = _CD_RE.sub("", name)
 
     # Clean whitespace
-    name = re.sub(r"\s+", " ", name).strip().lower()
+    name = _SPACES_RE.sub(" ", name).strip().lower()
 
     return name
 
@@ -94,27 +148,154 @@ class RomDatabase:
     """ROM database for fuzzy matching game names to serials."""
 
     def __init__(self):
-        self.entries: list[dict] = []
+        # Parallel columns, one row per TSV line
+        self.names: list[str] = []
+        self.clean_names: list[str] = []
+        self.regions: list[str] = []
+        self.serials: list[str | None] = []
+        self.platforms: list[str] = []
+        # Clean names and row numbers of entries that have a serial, per region (None = all regions)
+        self._choices: dict[str | None, tuple[list[str], list[int]]] = {}
+        # Trigram -> positions in the matching _choices names, per region
+        self._trigram_index: dict[str | None, dict[str, list[int]]] = {}
+        self._trigram_counts: dict[str | None, list[int]] = {}
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    @property
+    def entries(self) -> list[dict]:
+        """Rows as dicts, built on demand from the column lists."""
+        return [
+            {"name": name, "clean_name": clean_name, "region": region, "serial": serial, "platform": platform}
+            for name, clean_name, region, serial, platform in zip(
+                self.names, self.clean_names, self.regions, self.serials, self.platforms, strict=True
+            )
+        ]
+
+    def load_from_tsv(self, tsv_path: Path, use_cache: bool = True):
+        """Load database from TSV file (myrient format).
+
+        The parsed columns are cached as JSON in the user's cache folder, keyed by
+        the TSV's path, and reused while its mtime and size are unchanged.
+        """
+        tsv_path = Path(tsv_path)
+        key = hashlib.sha256(str(tsv_path.resolve()).encode()).hexdigest()[:32]
+        cache_path = _cache_dir() / f"romdb-{key}.json"
+        stat = tsv_path.stat()
+        source = (stat.st_mtime_ns, stat.st_size)
+
+        # Only an empty database can take the cached state wholesale
+        use_cache = use_cache and not self.names
+        if use_cache and self._load_cache(cache_path, source):
+            return
+
+        with open(tsv_path, encoding="utf-8", newline="") as f:
+            for row in csv.reader(f, delimiter="\t"):
+                if len(row) < 3:
+                    continue
+                platform, region, name = row[:3]
+
+                # Database names are seen once, so bypass the caches meant for scanned filenames
+                self.names.append(name)
+                self.clean_names.append(clean_game_name.__wrapped__(name))
+                self.regions.append(sys.intern(region))
+                # Extract serial from name if present
+                self.serials.append(extract_serial_from_filename.__wrapped__(name))
+                self.platforms.append(sys.intern(platform))
+
+        self._build_index()
+
+        if use_cache:
+            self._save_cache(cache_path, source)
+
+    def _load_cache(self, cache_path: Path, source: tuple[int, int]) -> bool:
+        """Restore the columns cached from the same TSV version, return whether they were used."""
+        try:
+            with open(cache_path, encoding="utf-8") as f:
+                state = json.load(f)
+        except (OSError, ValueError):
+            # Missing, truncated or not JSON; rebuild it
+            return False
+
+        if not isinstance(state, dict) or state.get("version") != CACHE_VERSION or state.get("source") != list(source):
+            return False
+
+        columns = [state.get(name) for name in _CACHE_COLUMNS]
+        if not all(isinstance(column, list) and len(column) == len(columns[0]) for column in columns):
+            return False
+        names, clean_names, regions, serials, platforms = columns
+        if not all(isinstance(value, str) for column in (names, clean_names, regions, platforms) for value in column):
+            return False
+        if not all(serial is None or isinstance(serial, str) for serial in serials):
+            return False
+
+        self.names = names
+        self.clean_names = clean_names
+        self.regions = [sys.intern(region) for region in regions]
+        self.serials = serials
+        self.platforms = [sys.intern(platform) for platform in platforms]
+        self._build_index()
+        return True
+
+    def _save_cache(self, cache_path: Path, source: tuple[int, int]) -> None:
+        """Atomically write the parsed columns to the cache, skipping unwritable folders."""
+        state = {"version": CACHE_VERSION, "source": list(source)}
+        state.update((name, getattr(self, name)) for name in _CACHE_COLUMNS)
+        try:
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            fd, temp_path = tempfile.mkstemp(dir=cache_path.parent, prefix=cache_path.name, suffix=".tmp")
+        except OSError:
+            return
+
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(state, f, separators=(",", ":"))
+            os.replace(temp_path, cache_path)
+        except OSError:
+            with suppress(OSError):
+                os.unlink(temp_path)
+
+    def _build_index(self):
+        """Group matchable rows by region so lookups skip filtering and serial checks."""
+        self._choices = {None: ([], [])}
+        self._trigram_index = {None: {}}
+        self._trigram_counts = {None: []}
+        for row, (clean_name, region, serial) in enumerate(
+            zip(self.clean_names, self.regions, self.serials, strict=True)
+        ):
+            if not serial:
+                continue
+            grams = _trigrams(clean_name)
+            for key in (None, region):
+                names, rows = self._choices.setdefault(key, ([], []))
+                index = self._trigram_index.setdefault(key, {})
+                for gram in grams:
+                    index.setdefault(gram, []).append(len(names))
+                self._trigram_counts.setdefault(key, []).append(len(grams))
+                names.append(clean_name)
+                rows.append(row)
+
+    def _candidates(self, clean_name: str, region: str | None) -> list[int] | None:
+        """Positions of the entries with the most similar trigram sets, in database order.
+
+        Returns None when the region is small enough to score every entry.
+        """
+        if len(self._choices[region][0]) <= FUZZY_CANDIDATES:
+            return None
 
-    def load_from_tsv(self, tsv_path: Path):
-        """Load database from TSV file (myrient format)."""
-        with open(tsv_path, encoding="utf-8") as f:
-            reader = csv.DictReader(f, delimiter="\t", fieldnames=["platform", "region", "name", "url", "size"])
+        index = self._trigram_index[region]
+        sizes = self._trigram_counts[region]
+        grams = _trigrams(clean_name)
+        shared: Counter[int] = Counter()
+        for gram in grams:
+            shared.update(index.get(gram, ()))
 
-            for row in reader:
-                # Extract serial from name if present
-                serial = extract_serial_from_filename(row["name"])
-                clean_name = clean_game_name(row["name"])
-
-                self.entries.append(
-                    {
-                        "name": row["name"],
-                        "clean_name": clean_name,
-                        "region": row["region"],
-                        "serial": serial,
-                        "platform": row["platform"],
-                    }
-                )
+        # Jaccard similarity, so long names sharing every query trigram do not crowd out close matches
+        def similarity(position: int) -> float:
+            return shared[position] / (len(grams) + sizes[position] - shared[position])
+
+        return sorted(heapq.nlargest(FUZZY_CANDIDATES, shared, key=similarity))
 
     def find_serial(
         self, game_name: str, region: str | None = None, threshold: float = 75.0
@@ -133,30 +314,39 @@ class RomDatabase:
         clean_name = clean_game_name(game_name)
 
         # Filter by region if provided
-        candidates = self.entries
-        if region:
-            candidates = [e for e in candidates if e["region"] == region]
+        region = region or None
+        if region not in self._choices:
+            return None
+        names, rows = self._choices[region]
 
-        best_match = None
-        best_score = 0.0
+        # Only fuzzy score the entries that share the most trigrams with the query
+        candidates = self._candidates(clean_name, region)
+        if candidates is not None:
+            names = [names[i] for i in candidates]
+            rows = [rows[i] for i in candidates]
 
-        for entry in candidates:
-            if not entry["serial"]:
-                continue
+        # Substring matches get +10 below, so nothing under threshold - 10 can win
+        matches = process.extract(
+            clean_name, names, scorer=fuzz.ratio, score_cutoff=max(threshold - 10.5, 0), limit=None
+        )
+
+        best_row = None
+        best_score = 0.0
 
-            # Use fuzzy matching
-            score = fuzz.ratio(clean_name, entry["clean_name"])
+        # Visit in database order so ties keep going to the first entry
+        for name, ratio, index in sorted(matches, key=lambda match: match[2]):
+            score = round(ratio)
 
             # Boost for exact substring matches
-            if clean_name in entry["clean_name"] or entry["clean_name"] in clean_name:
+            if clean_name in name or name in clean_name:
                 score += 10
 
             if score > best_score:
                 best_score = score
-                best_match = entry
+                best_row = rows[index]
 
-        if best_score >= threshold and best_match:
-            return best_match["serial"], best_score
+        if best_score >= threshold and best_row is not None:
+            return self.serials[best_row], best_score
 
         return None
 
@@ -164,12 +354,17 @@ class RomDatabase:
 class SerialResolver:
     """Resolve game serials using multiple strategies."""
 
+    # Resolved (filename, platform, use_fuzzy) lookups kept for rescans
+    CACHE_SIZE = 100_000
+
     def __init__(self, databases: dict[str, RomDatabase] | None = None):
         self.databases = databases or {}
+        self._cache: OrderedDict[tuple[str, str, bool], tuple[str, str] | None] = OrderedDict()
 
     def add_database(self, platform: str, database: RomDatabase):
         """Add ROM database for a platform."""
         self.databases[platform] = database
+        self._cache.clear()
 
     async def resolve(self, filename: str, platform: str, use_fuzzy: bool = True) -> tuple[str, str] | None:
         """
@@ -184,6 +379,19 @@ class SerialResolver:
             Tuple of (serial, method) or None
             method: 'filename' | 'fuzzy_exact' | 'fuzzy_region' | 'fuzzy'
         """
+        key = (filename, platform, use_fuzzy)
+        if key in self._cache:
+            self._cache.move_to_end(key)
+            return self._cache[key]
+
+        result = self._resolve(filename, platform, use_fuzzy)
+
+        self._cache[key] = result
+        if len(self._cache) > self.CACHE_SIZE:
+            self._cache.popitem(last=False)
+        return result
+
+    def _resolve(self, filename: str, platform: str, use_fuzzy: bool) -> tuple[str, str] | None:
         # Strategy 1: Extract from filename
         serial = extract_serial_from_filename(filename)
         if serial:
@@ -99,34 +99,33 @@ class GameOrganizer:
         if self.any_image and images_here:
             return images_here[0]
 
+        # Candidate names are checked against the listings instead of an exists() each
+        names_here = {self.fs.basename(image) for image in images_here}
+
         # 1. Exact match with different extension
         for ext in DEFAULT_COVER_EXTS:
-            cover_path = self.fs.join_path(folder, base_name + ext)
-            if await self.fs.exists(cover_path):
-                return cover_path
+            if base_name + ext in names_here:
+                return self.fs.join_path(folder, base_name + ext)
 
         # 2. Same folder named as parent folder
         for ext in DEFAULT_COVER_EXTS:
-            cover_path = self.fs.join_path(folder, parent_basename + ext)
-            if await self.fs.exists(cover_path):
-                return cover_path
+            if parent_basename + ext in names_here:
+                return self.fs.join_path(folder, parent_basename + ext)
 
         # 3. Parent folder named as parent folder
-        if await self.fs.exists(parent):
-            for ext in DEFAULT_COVER_EXTS:
-                cover_path = self.fs.join_path(parent, parent_basename + ext)
-                if await self.fs.exists(cover_path):
-                    return cover_path
+        images_parent = await self.find_images_in_folder(parent) if await self.fs.exists(parent) else []
+        names_parent = {self.fs.basename(image) for image in images_parent}
+        for ext in DEFAULT_COVER_EXTS:
+            if parent_basename + ext in names_parent:
+                return self.fs.join_path(parent, parent_basename + ext)
 
         # 4. If exactly one image exists in folder
         if len(images_here) == 1:
             return images_here[0]
 
         # 5. Parent folder single image
-        if await self.fs.exists(parent):
-            images_parent = await self.find_images_in_folder(parent)
-            if len(images_parent) == 1:
-                return images_parent[0]
+        if len(images_parent) == 1:
+            return images_parent[0]
 
         return None
 
@@ -136,8 +135,9 @@ class GameOrganizer:
 
         Groups files by stem (filename without extension).
         """
-        # Collect all game files
+        # Collect all game files, plus every file name per folder for cover lookups
         all_files = []
+        names_by_folder: defaultdict[str, set[str]] = defaultdict(set)
 
         async def _scan_recursive(path: str):
             if not await self.fs.exists(path):
@@ -147,6 +147,7 @@ class GameOrganizer:
                 if item.is_dir:
                     await _scan_recursive(item.path)
                 else:
+                    names_by_folder[self.fs.dirname(item.path)].add(item.name)
                     ext = Path(item.name).suffix.lower()
                     if ext in GAME_EXTS:
                         all_files.append(item.path)
@@ -166,13 +167,12 @@ class GameOrganizer:
 
         for folder, stems in grouped.items():
             for stem, files in stems.items():
-                # Check for existing exact cover
-                existing_cover = None
-                for file_path in files:
-                    cover = await self.has_exact_cover(file_path)
-                    if cover:
-                        existing_cover = cover
-                        break
+                # Check for existing exact cover (all files in a group share folder and stem)
+                names = names_by_folder[folder]
+                existing_cover = next(
+                    (self.fs.join_path(folder, stem + ext) for ext in DEFAULT_COVER_EXTS if stem + ext in names),
+                    None,
+                )
 
                 game_groups.append(
                     GameGroup(
@@ -168,29 +168,30 @@ class GameOrganizer:
         """
         cover_exts = [".PNG", ".png", ".JPG", ".jpg"]
 
+        # One listing answers every candidate name instead of an exists() per extension
+        names = set()
+        images = []
+        async for item in self.fs.list_dir(folder):
+            if item.is_dir:
+                continue
+
+            name = self.fs.basename(item.path)
+            names.add(name)
+            if name[name.rfind(".") :] in cover_exts:
+                images.append(item.path)
+
         # Check for exact match
         for ext in cover_exts:
-            cover_path = self.fs.join_path(folder, game_name + ext)
-            if await self.fs.exists(cover_path):
-                return cover_path
+            if game_name + ext in names:
+                return self.fs.join_path(folder, game_name + ext)
 
         # Check for folder-named cover
         folder_name = self.fs.basename(folder)
         for ext in cover_exts:
-            cover_path = self.fs.join_path(folder, folder_name + ext)
-            if await self.fs.exists(cover_path):
-                return cover_path
+            if folder_name + ext in names:
+                return self.fs.join_path(folder, folder_name + ext)
 
         # Check if only one image exists
-        images = []
-        async for item in self.fs.list_dir(folder):
-            if item.is_dir:
-                continue
-
-            file_ext = self.fs.basename(item.path)[self.fs.basename(item.path).rfind(".") :]
-            if file_ext in cover_exts:
-                images.append(item.path)
-
         if len(images) == 1:
             return images[0]
 
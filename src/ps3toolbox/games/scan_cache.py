@@ -0,0 +1,85 @@
+"""On-disk cache of resolved serials so rescans skip matching for unchanged games."""
+
+import sqlite3
+from collections.abc import Iterable
+from itertools import islice
+from pathlib import Path
+
+from .scanner import GameFile
+
+
+# Rows per executemany() write and paths per lookup query (kept under SQLite's variable limit)
+BATCH_SIZE = 1000
+LOOKUP_BATCH = 500
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS games (
+    path TEXT PRIMARY KEY,
+    mtime INTEGER NOT NULL,
+    size INTEGER NOT NULL,
+    platform TEXT NOT NULL,
+    serial TEXT NOT NULL,
+    method TEXT NOT NULL
+)
+"""
+
+
+def _batched(items: Iterable, size: int) -> Iterable[list]:
+    it = iter(items)
+    while batch := list(islice(it, size)):
+        yield batch
+
+
+class ScanCache:
+    """
+    SQLite store of resolved serials keyed by game path.
+
+    An entry is only reused while the file's (mtime, size) still match the
+    scan. Only found serials are stored, so games that failed to resolve get
+    another try once better ROM databases are loaded.
+    """
+
+    def __init__(self, path: str | Path):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(self.path)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(_SCHEMA)
+        self._conn.commit()
+
+    def lookup(self, games: Iterable[GameFile]) -> dict[str, tuple[str, str]]:
+        """Return {path: (serial, method)} for games unchanged since they were cached."""
+        hits: dict[str, tuple[str, str]] = {}
+
+        for batch in _batched(games, LOOKUP_BATCH):
+            by_path = {game.path: game for game in batch}
+            placeholders = ",".join("?" * len(by_path))
+            rows = self._conn.execute(
+                f"SELECT path, mtime, size, platform, serial, method FROM games WHERE path IN ({placeholders})",
+                list(by_path),
+            )
+
+            for path, mtime, size, platform, serial, method in rows:
+                game = by_path[path]
+                if (mtime, size, platform) == (game.mtime, game.size, game.platform):
+                    hits[path] = (serial, method)
+
+        return hits
+
+    def store(self, results: Iterable[tuple[GameFile, tuple[str, str]]]) -> None:
+        """Save resolved (serial, method) pairs, replacing stale entries."""
+        rows = ((game.path, game.mtime, game.size, game.platform, serial, method) for game, (serial, method) in results)
+
+        with self._conn:
+            for batch in _batched(rows, BATCH_SIZE):
+                self._conn.executemany("INSERT OR REPLACE INTO games VALUES (?, ?, ?, ?, ?, ?)", batch)
+
+    def close(self) -> None:
+        """Close the database connection."""
+        self._conn.close()
+
+    def __enter__(self) -> "ScanCache":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
@@ -1,13 +1,17 @@
 """Game scanner for PS1/PS2/ROM files with platform detection."""
 
+import asyncio
+import sys
 from collections.abc import AsyncIterator
 from dataclasses import dataclass
+from types import MappingProxyType
 from typing import Any
 
+from ps3toolbox.utils.fs import FileInfo
 from ps3toolbox.utils.fs import FilesystemProvider
 
 
-@dataclass
+@dataclass(slots=True)
 class GameFile:
     """Represents a game file with metadata."""
 
@@ -18,6 +22,9 @@ class GameFile:
     extensions: list[str]
     has_cover: bool
     cover_path: str | None
+    # Primary file's size and mtime (ns) from the listing, used to validate cached lookups
+    size: int = 0
+    mtime: int = 0
 
 
 PLATFORM_FOLDERS = {
@@ -26,56 +33,66 @@ PLATFORM_FOLDERS = {
     "ROMS": ["ROMS"],
 }
 
-ROM_PLATFORMS = {
-    "nes": "NES",
-    "snes": "SNES",
-    "gb": "GB",
-    "gbc": "GBC",
-    "gba": "GBA",
-    "genesis": "Genesis",
-    "gen": "Genesis",
-    "megadrive": "Genesis",
-    "sms": "SMS",
-    "n64": "N64",
-    "atari2600": "Atari2600",
-    "atari5200": "Atari5200",
-    "atari7800": "Atari7800",
-    "lynx": "Lynx",
-    "mame": "MAME",
-    "mameplus": "MAME",
-}
-
-PS1_EXTENSIONS = {".bin", ".cue", ".img", ".pbp"}
-PS2_EXTENSIONS = {".iso"}
-ROM_EXTENSIONS = {
-    ".nes",
-    ".smc",
-    ".sfc",
-    ".gb",
-    ".gbc",
-    ".gba",
-    ".gen",
-    ".md",
-    ".bin",
-    ".sms",
-    ".z64",
-    ".n64",
-    ".v64",
-    ".a26",
-    ".a52",
-    ".a78",
-    ".lnx",
-    ".zip",
-}
-
-COVER_EXTENSIONS = {".png", ".jpg", ".PNG", ".JPG"}
+ROM_PLATFORMS = MappingProxyType(
+    {
+        "nes": "NES",
+        "snes": "SNES",
+        "gb": "GB",
+        "gbc": "GBC",
+        "gba": "GBA",
+        "genesis": "Genesis",
+        "gen": "Genesis",
+        "megadrive": "Genesis",
+        "sms": "SMS",
+        "n64": "N64",
+        "atari2600": "Atari2600",
+        "atari5200": "Atari5200",
+        "atari7800": "Atari7800",
+        "lynx": "Lynx",
+        "mame": "MAME",
+        "mameplus": "MAME",
+    }
+)
+
+PS1_EXTENSIONS = frozenset({".bin", ".cue", ".img", ".pbp"})
+PS2_EXTENSIONS = frozenset({".iso"})
+ROM_EXTENSIONS = frozenset(
+    {
+        ".nes",
+        ".smc",
+        ".sfc",
+        ".gb",
+        ".gbc",
+        ".gba",
+        ".gen",
+        ".md",
+        ".bin",
+        ".sms",
+        ".z64",
+        ".n64",
+        ".v64",
+        ".a26",
+        ".a52",
+        ".a78",
+        ".lnx",
+        ".zip",
+    }
+)
+
+COVER_EXTENSIONS = frozenset({".png", ".jpg", ".PNG", ".JPG"})
+
+# Reverse lookups built once at import time
+_FOLDER_TO_PLATFORM: dict[str, str] = {name: plat for plat, names in PLATFORM_FOLDERS.items() for name in names}
+_ALL_GAME_EXTS = PS1_EXTENSIONS | PS2_EXTENSIONS
 
 
 class GameScanner:
     """Scan filesystem for games and their covers."""
 
-    def __init__(self, fs: FilesystemProvider):
+    def __init__(self, fs: FilesystemProvider, max_workers: int = 16):
         self.fs = fs
+        # Directory listings kept in flight at once while walking game folders
+        self.max_workers = max_workers
 
     async def scan_root(self, root_path: str) -> AsyncIterator[GameFile]:
         """
@@ -93,13 +110,10 @@ class GameScanner:
             if not item.is_dir:
                 continue
 
-            folder_name_upper = item.name.upper()
-
             # Check if it's a known platform folder
-            for platform, folder_names in PLATFORM_FOLDERS.items():
-                if folder_name_upper in folder_names:
-                    platform_paths[platform] = item.path
-                    break
+            platform = _FOLDER_TO_PLATFORM.get(item.name.upper())
+            if platform:
+                platform_paths[platform] = item.path
 
         # Scan each platform
         if "PS1" in platform_paths:
@@ -131,18 +145,18 @@ class GameScanner:
             yield game
 
     async def _scan_disc_games(
-        self, base_path: str, platform: str, valid_extensions: set[str]
+        self, base_path: str, platform: str, valid_extensions: frozenset[str]
     ) -> AsyncIterator[GameFile]:
         """Scan directory for disc-based games (PS1/PS2)."""
-        async for game_folder in self._find_game_folders(base_path):
+        for game_folder, entries in await self._find_game_folders(base_path):
             # Group files by game
             game_files: dict[str, dict[str, Any]] = {}
 
-            async for item in self.fs.list_dir(game_folder):
+            for item in entries:
                 if item.is_dir:
                     continue
 
-                file_ext = self.fs.basename(item.path)[self.fs.basename(item.path).rfind(".") :].lower()
+                file_ext = item.name[item.name.rfind(".") :].lower()
 
                 # Game file
                 if file_ext in valid_extensions:
@@ -151,6 +165,7 @@ class GameScanner:
                         game_files[stem] = {
                             "files": [],
                             "cover": None,
+                            "primary": item,
                         }
                     game_files[stem]["files"].append(item.path)
 
@@ -171,46 +186,52 @@ class GameScanner:
                 if not data["files"]:
                     continue
 
-                # Get all extensions for this game
-                extensions = [self.fs.basename(f)[self.fs.basename(f).rfind(".") :].lower() for f in data["files"]]
+                # Get all extensions for this game (interned, a library only has a handful)
+                extensions = [sys.intern(f[f.rfind(".") :].lower()) for f in map(self.fs.basename, data["files"])]
 
                 # Use first file as primary
-                primary_file = data["files"][0]
+                primary: FileInfo = data["primary"]
 
                 yield GameFile(
-                    path=primary_file,
+                    path=primary.path,
                     name=stem,
                     platform=platform,
                     folder=game_folder,
                     extensions=extensions,
                     has_cover=data["cover"] is not None,
                     cover_path=data["cover"],
+                    size=primary.size,
+                    mtime=primary.mtime,
                 )
 
-    async def _find_game_folders(self, base_path: str) -> AsyncIterator[str]:
+    async def _find_game_folders(self, base_path: str) -> list[tuple[str, list[FileInfo]]]:
         """
-        Find all folders that contain game files.
+        Find all folders that contain game files, with their listings.
 
         Searches recursively to handle:
         - Games directly in base_path
         - Games in subfolders (organized by letter, etc.)
+
+        Sibling folders are listed concurrently (up to max_workers at once) to
+        hide per-directory latency on FTP and network mounts. Results keep
+        depth-first order, subfolders before their parent.
         """
-        # Check current folder
-        has_game_files = False
+        semaphore = asyncio.Semaphore(self.max_workers)
 
-        async for item in self.fs.list_dir(base_path):
-            if item.is_dir:
-                # Recursively check subfolders
-                async for subfolder in self._find_game_folders(item.path):
-                    yield subfolder
-            else:
-                # Check if this is a game file
-                file_ext = self.fs.basename(item.path)[self.fs.basename(item.path).rfind(".") :].lower()
-                if file_ext in PS1_EXTENSIONS or file_ext in PS2_EXTENSIONS:
-                    has_game_files = True
-
-        if has_game_files:
-            yield base_path
+        async def walk(path: str) -> list[tuple[str, list[FileInfo]]]:
+            async with semaphore:
+                entries = [item async for item in self.fs.list_dir(path)]
+
+            # Recursively check subfolders
+            nested = await asyncio.gather(*(walk(item.path) for item in entries if item.is_dir))
+            folders = [folder for subfolders in nested for folder in subfolders]
+
+            # Check if this folder has game files
+            if any(not item.is_dir and item.name[item.name.rfind(".") :].lower() in _ALL_GAME_EXTS for item in entries):
+                folders.append((path, entries))
+            return folders
+
+        return await walk(base_path)
 
     async def _scan_roms(self, roms_path: str) -> AsyncIterator[GameFile]:
         """
@@ -238,27 +259,38 @@ class GameScanner:
 
     async def _scan_rom_platform(self, platform_path: str, platform: str) -> AsyncIterator[GameFile]:
         """Scan a specific ROM platform folder."""
-        async for item in self.fs.list_dir(platform_path):
+        entries = [item async for item in self.fs.list_dir(platform_path)]
+
+        # Index the listing by stem so covers are found without extra exists() round-trips
+        entries_by_stem: dict[str, list[str]] = {}
+        for item in entries:
+            if not item.is_dir:
+                entries_by_stem.setdefault(self.fs.stem(item.path), []).append(item.path)
+
+        # Every file in the listing shares one folder string
+        folder = None
+
+        for item in entries:
             if item.is_dir:
                 # Recursively scan subfolders
                 async for rom in self._scan_rom_platform(item.path, platform):
                     yield rom
                 continue
 
-            file_ext = self.fs.basename(item.path)[self.fs.basename(item.path).rfind(".") :].lower()
+            file_ext = item.name[item.name.rfind(".") :].lower()
 
             if file_ext not in ROM_EXTENSIONS:
                 continue
 
             stem = self.fs.stem(item.path)
-            folder = self.fs.dirname(item.path)
+            if folder is None:
+                folder = self.fs.dirname(item.path)
 
             # Check for cover
             cover_path = None
-            for cover_ext in COVER_EXTENSIONS:
-                potential_cover = self.fs.join_path(folder, stem + cover_ext)
-                if await self.fs.exists(potential_cover):
-                    cover_path = potential_cover
+            for candidate in entries_by_stem.get(stem, []):
+                if candidate[candidate.rfind(".") :] in COVER_EXTENSIONS:
+                    cover_path = candidate
                     break
 
             yield GameFile(
@@ -266,7 +298,9 @@ class GameScanner:
                 name=stem,
                 platform=platform,
                 folder=folder,
-                extensions=[file_ext],
+                extensions=[sys.intern(file_ext)],
                 has_cover=cover_path is not None,
                 cover_path=cover_path,
+                size=item.size,
+                mtime=item.mtime,
             )
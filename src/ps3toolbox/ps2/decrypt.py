@@ -11,6 +11,10 @@ from ps3toolbox.core.keys import get_base_keys
 from ps3toolbox.ps2.header import PS2Metadata
 from ps3toolbox.ps2.header import parse_ps2_header
 from ps3toolbox.ps2.header import verify_header
+from ps3toolbox.utils.direct_io import aligned_buffer
+from ps3toolbox.utils.direct_io import open_reader
+from ps3toolbox.utils.direct_io import open_writer
+from ps3toolbox.utils.direct_io import read_into
 from ps3toolbox.utils.errors import CorruptedFileError
 from ps3toolbox.utils.progress import ProgressCallback
 
@@ -21,6 +25,7 @@ def decrypt_ps2_iso(
     mode: str = "cex",
     klicensee: bytes | None = None,
     progress_callback: ProgressCallback | None = None,
+    direct_io: bool = True,
 ) -> None:
     """Decrypt .BIN.ENC to ISO format."""
     with open(encrypted_path, "rb") as f:
@@ -38,18 +43,21 @@ def decrypt_ps2_iso(
 
     zero_iv = bytes(16)
 
-    with open(encrypted_path, "rb") as in_f, open(output_path, "wb") as out_f:
+    meta_read_buffer = aligned_buffer(SEGMENT_SIZE)
+    data_read_buffer = aligned_buffer(SEGMENT_SIZE * NUM_CHILD_SEGMENTS)
+
+    with open_reader(encrypted_path, direct_io) as in_f, open_writer(output_path, data_size, direct_io) as out_f:
         in_f.seek(SEGMENT_SIZE)
 
         remaining = data_size
         bytes_processed = 0
 
         while remaining > 0:
-            meta_buffer = in_f.read(SEGMENT_SIZE)
+            meta_buffer = read_into(in_f, meta_read_buffer)
             if not meta_buffer:
                 break
 
-            data_buffer = in_f.read(SEGMENT_SIZE * NUM_CHILD_SEGMENTS)
+            data_buffer = read_into(in_f, data_read_buffer)
             if not data_buffer:
                 break
 
@@ -74,6 +82,8 @@ def decrypt_ps2_iso(
             if progress_callback:
                 progress_callback(bytes_processed, data_size)
 
+        out_f.truncate()
+
 
 def extract_metadata(encrypted_path: Path) -> PS2Metadata:
     """Extract metadata from encrypted PS2 Classic file."""
@@ -1,12 +1,21 @@
 """PS2 ISO encryption to .BIN.ENC format."""
 
+import mmap
 import os
+import queue
 import shutil
 import struct
 import tempfile
+import threading
+from collections import deque
+from concurrent.futures import Future
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
+from typing import BinaryIO
 
+from ps3toolbox.core.crypto import CBC_INTO_SLACK
 from ps3toolbox.core.crypto import aes128_cbc_encrypt
+from ps3toolbox.core.crypto import aes128_cbc_encrypt_into
 from ps3toolbox.core.crypto import calculate_sha1
 from ps3toolbox.core.crypto import derive_keys
 from ps3toolbox.core.iso import pad_iso_to_boundary
@@ -19,16 +28,231 @@ from ps3toolbox.core.keys import SEGMENT_SIZE
 from ps3toolbox.core.keys import get_base_keys
 from ps3toolbox.ps2.header import build_ps2_header
 from ps3toolbox.ps2.limg import add_limg_header
+from ps3toolbox.utils.direct_io import aligned_buffer
+from ps3toolbox.utils.direct_io import open_reader
+from ps3toolbox.utils.direct_io import open_writer
+from ps3toolbox.utils.direct_io import read_into
 from ps3toolbox.utils.progress import ProgressCallback
 
 
+CHUNK_SIZE = SEGMENT_SIZE * NUM_CHILD_SEGMENTS
+RING_SIZE = 4
+# Parallel encryption keeps at most this many chunks in flight (128 MiB) regardless of worker count
+MAX_IN_FLIGHT = 16
+# Process count the CLI uses by default; beyond a few workers the output disk is the bottleneck
+DEFAULT_WORKERS = min(os.cpu_count() or 1, 4)
+
+_ZERO_IV = bytes(16)
+_ZERO_META = memoryview(bytes(SEGMENT_SIZE))
+
+ChunkBuffers = tuple[bytearray, bytearray]
+
+
+def encrypted_size(iso_size: int) -> int:
+    """Size of the .BIN.ENC produced for an ISO of `iso_size` bytes (header + meta + data)."""
+    num_segments = (iso_size + SEGMENT_SIZE - 1) // SEGMENT_SIZE
+    num_chunks = (num_segments + NUM_CHILD_SEGMENTS - 1) // NUM_CHILD_SEGMENTS
+    return SEGMENT_SIZE * (1 + num_chunks + num_segments)
+
+
+def _encrypt_chunk(
+    data_chunk: memoryview,
+    buffers: ChunkBuffers,
+    data_key: bytes,
+    meta_key: bytes,
+    first_segment: int,
+    disc_num_encoded: int,
+) -> bytes:
+    """Encrypt one chunk of segments into buffers, return the encrypted meta segment."""
+    encrypted_data, meta_buffer = buffers
+    encrypted_view = memoryview(encrypted_data)
+    actual_segments = len(data_chunk) // SEGMENT_SIZE
+
+    for i in range(actual_segments):
+        segment_start = i * SEGMENT_SIZE
+        segment_end = segment_start + SEGMENT_SIZE
+
+        aes128_cbc_encrypt_into(
+            data_key, _ZERO_IV, data_chunk[segment_start:segment_end], encrypted_view[segment_start:]
+        )
+
+        meta_offset = i * META_ENTRY_SIZE
+        meta_buffer[meta_offset : meta_offset + 20] = calculate_sha1(encrypted_view[segment_start:segment_end])
+        struct.pack_into(">I", meta_buffer, meta_offset + 0x14, disc_num_encoded | (first_segment + i))
+
+    # Buffers are recycled, so clear entries left over from a previous (longer) chunk
+    meta_used = actual_segments * META_ENTRY_SIZE
+    meta_buffer[meta_used:] = _ZERO_META[meta_used:]
+
+    return aes128_cbc_encrypt(meta_key, _ZERO_IV, meta_buffer)
+
+
+def _write_chunks(
+    out_f: BinaryIO,
+    write_q: queue.Queue[tuple[bytes, ChunkBuffers, int] | None],
+    free_q: queue.Queue[ChunkBuffers],
+    errors: list[BaseException],
+) -> None:
+    """Writer thread: write encrypted chunks in order and hand buffers back to the ring."""
+    while True:
+        item = write_q.get()
+        if item is None:
+            return
+
+        encrypted_meta, buffers, length = item
+        try:
+            if not errors:
+                out_f.write(encrypted_meta)
+                out_f.write(memoryview(buffers[0])[:length])
+        except BaseException as e:
+            errors.append(e)
+        finally:
+            free_q.put(buffers)
+
+
+def _pad_chunk(buffer: mmap.mmap, data_chunk: memoryview) -> memoryview:
+    """Zero-pad a final partial segment in place, return the segment-aligned view."""
+    if not len(data_chunk) % SEGMENT_SIZE:
+        return data_chunk
+
+    padded = (len(data_chunk) + SEGMENT_SIZE - 1) // SEGMENT_SIZE * SEGMENT_SIZE
+    buffer[len(data_chunk) : padded] = bytes(padded - len(data_chunk))
+    return memoryview(buffer)[:padded]
+
+
+def _encrypt_serial(
+    out_f: BinaryIO,
+    source_iso: Path,
+    final_size: int,
+    data_key: bytes,
+    meta_key: bytes,
+    disc_num_encoded: int,
+    direct_io: bool,
+    progress_callback: ProgressCallback | None,
+) -> None:
+    """Encrypt on this thread while a writer thread drains finished chunks."""
+    read_buffer = aligned_buffer(CHUNK_SIZE)
+
+    # Ring of reusable output buffers shared with the writer thread
+    free_q: queue.Queue[ChunkBuffers] = queue.Queue()
+    for _ in range(RING_SIZE):
+        free_q.put((bytearray(CHUNK_SIZE + CBC_INTO_SLACK), bytearray(SEGMENT_SIZE)))
+    write_q: queue.Queue[tuple[bytes, ChunkBuffers, int] | None] = queue.Queue()
+    errors: list[BaseException] = []
+
+    with open_reader(source_iso, direct_io) as in_f:
+        writer = threading.Thread(target=_write_chunks, args=(out_f, write_q, free_q, errors), daemon=True)
+        writer.start()
+
+        try:
+            segment_number = 0
+            bytes_processed = 0
+
+            while not errors:
+                data_chunk = read_into(in_f, read_buffer)
+                if not data_chunk:
+                    break
+
+                data_chunk = _pad_chunk(read_buffer, data_chunk)
+                actual_segments = len(data_chunk) // SEGMENT_SIZE
+
+                buffers = free_q.get()
+                encrypted_meta = _encrypt_chunk(
+                    data_chunk, buffers, data_key, meta_key, segment_number, disc_num_encoded
+                )
+                write_q.put((encrypted_meta, buffers, len(data_chunk)))
+                segment_number += actual_segments
+
+                bytes_processed += len(data_chunk)
+                if progress_callback:
+                    progress_callback(bytes_processed, final_size)
+        finally:
+            write_q.put(None)
+            writer.join()
+
+    if errors:
+        raise errors[0]
+
+
+def _encrypt_chunk_at(
+    source_iso: Path,
+    index: int,
+    data_key: bytes,
+    meta_key: bytes,
+    disc_num_encoded: int,
+    direct_io: bool,
+) -> tuple[bytes, bytes]:
+    """Process pool task: read chunk `index` of the source and return (encrypted meta, encrypted data)."""
+    read_buffer = aligned_buffer(CHUNK_SIZE)
+    with open_reader(source_iso, direct_io) as in_f:
+        in_f.seek(index * CHUNK_SIZE)
+        data_chunk = _pad_chunk(read_buffer, read_into(in_f, read_buffer))
+
+    buffers = (bytearray(CHUNK_SIZE + CBC_INTO_SLACK), bytearray(SEGMENT_SIZE))
+    first_segment = index * NUM_CHILD_SEGMENTS
+    encrypted_meta = _encrypt_chunk(data_chunk, buffers, data_key, meta_key, first_segment, disc_num_encoded)
+    return encrypted_meta, bytes(memoryview(buffers[0])[: len(data_chunk)])
+
+
+def _encrypt_parallel(
+    out_f: BinaryIO,
+    source_iso: Path,
+    final_size: int,
+    data_key: bytes,
+    meta_key: bytes,
+    disc_num_encoded: int,
+    direct_io: bool,
+    progress_callback: ProgressCallback | None,
+    workers: int,
+) -> None:
+    """Encrypt chunks across a process pool, writing results in order.
+
+    Workers read their chunk from the source themselves, so only ciphertext
+    crosses the process boundary. At most two chunks per worker, and never
+    more than MAX_IN_FLIGHT, are in flight to bound memory.
+    """
+    num_chunks = (final_size + CHUNK_SIZE - 1) // CHUNK_SIZE
+    window = min(workers * 2, MAX_IN_FLIGHT)
+    pending: deque[Future[tuple[bytes, bytes]]] = deque()
+    bytes_processed = 0
+
+    def write_next() -> None:
+        nonlocal bytes_processed
+        encrypted_meta, encrypted_data = pending.popleft().result()
+        out_f.write(encrypted_meta)
+        out_f.write(encrypted_data)
+
+        bytes_processed = min(bytes_processed + CHUNK_SIZE, final_size)
+        if progress_callback:
+            progress_callback(bytes_processed, final_size)
+
+    with ProcessPoolExecutor(max_workers=min(workers, window)) as pool:
+        try:
+            for index in range(num_chunks):
+                pending.append(
+                    pool.submit(_encrypt_chunk_at, source_iso, index, data_key, meta_key, disc_num_encoded, direct_io)
+                )
+                if len(pending) >= window:
+                    write_next()
+
+            while pending:
+                write_next()
+        finally:
+            for future in pending:
+                future.cancel()
+
+
 def encrypt_ps2_iso(
     iso_path: Path,
     output_path: Path,
+    *,
     mode: str = "cex",
     content_id: str | None = None,
     disc_num: int = 1,
+    use_temp: bool = True,
     progress_callback: ProgressCallback | None = None,
+    direct_io: bool = True,
+    workers: int = 1,
 ) -> None:
     """Encrypt PS2 ISO to .BIN.ENC format.
 
@@ -38,73 +262,58 @@ def encrypt_ps2_iso(
         mode: Console mode ('cex' for retail, 'dex' for debug)
         content_id: Content ID string (uses placeholder if None)
         disc_num: Disc number for multi-disc games (1-9)
+        use_temp: Pad a temporary copy of the ISO; when False the input ISO is
+            padded and given its LIMG header in place (no copy is made), and is
+            truncated back to its original size if encryption fails
         progress_callback: Optional progress callback function
+        direct_io: Bypass the page cache for bulk reads (falls back to buffered I/O)
+        workers: Processes encrypting chunks in parallel (1 encrypts on the calling thread)
     """
     if not 1 <= disc_num <= 9:
         raise ValueError(f"Disc number must be 1-9, got {disc_num}")
 
     validate_iso(iso_path)
 
+    disc_num_encoded = (disc_num - 1) << 24
+
     temp_iso = None
+    original_size = iso_path.stat().st_size
     try:
-        temp_fd, temp_iso_path = tempfile.mkstemp(suffix=".iso", prefix="ps2enc_")
-        os.close(temp_fd)
-        temp_iso = Path(temp_iso_path)
+        if use_temp:
+            temp_fd, temp_iso_path = tempfile.mkstemp(suffix=".iso", prefix="ps2enc_")
+            os.close(temp_fd)
+            temp_iso = Path(temp_iso_path)
 
-        shutil.copy2(iso_path, temp_iso)
+            shutil.copy2(iso_path, temp_iso)
+            source_iso = temp_iso
+        else:
+            source_iso = iso_path
 
-        pad_iso_to_boundary(temp_iso)
-        final_size = add_limg_header(temp_iso)
+        pad_iso_to_boundary(source_iso)
+        final_size = add_limg_header(source_iso)
 
         base_data_key, base_meta_key = get_base_keys(mode)
         data_key, meta_key = derive_keys(base_data_key, base_meta_key, PS2_PLACEHOLDER_KLIC)
 
-        zero_iv = bytes(16)
         cid = content_id or PS2_PLACEHOLDER_CID
         header = build_ps2_header(cid, "ISO.BIN.ENC", final_size)
 
-        disc_num_encoded = (disc_num - 1) << 24
-
-        with open(output_path, "wb") as out_f, open(temp_iso, "rb") as in_f:
+        with open_writer(output_path, encrypted_size(final_size), direct_io) as out_f:
             out_f.write(header)
 
-            segment_number = 0
-            bytes_processed = 0
-
-            while True:
-                data_chunk = in_f.read(SEGMENT_SIZE * NUM_CHILD_SEGMENTS)
-                if not data_chunk:
-                    break
-
-                actual_segments = (len(data_chunk) + SEGMENT_SIZE - 1) // SEGMENT_SIZE
-                if len(data_chunk) % SEGMENT_SIZE:
-                    data_chunk += b"\x00" * (actual_segments * SEGMENT_SIZE - len(data_chunk))
-
-                meta_buffer = bytearray(SEGMENT_SIZE)
-                encrypted_data = bytearray()
+            args = (out_f, source_iso, final_size, data_key, meta_key, disc_num_encoded, direct_io, progress_callback)
+            if workers > 1 and final_size > CHUNK_SIZE:
+                _encrypt_parallel(*args, workers)
+            else:
+                _encrypt_serial(*args)
 
-                for i in range(actual_segments):
-                    segment_start = i * SEGMENT_SIZE
-                    segment_end = segment_start + SEGMENT_SIZE
-                    segment_data = data_chunk[segment_start:segment_end]
+            out_f.truncate()
 
-                    encrypted_segment = aes128_cbc_encrypt(data_key, zero_iv, segment_data)
-                    encrypted_data.extend(encrypted_segment)
-
-                    hash_value = calculate_sha1(encrypted_segment)
-                    meta_offset = i * META_ENTRY_SIZE
-                    meta_buffer[meta_offset : meta_offset + 20] = hash_value
-                    struct.pack_into(">I", meta_buffer, meta_offset + 0x14, disc_num_encoded | segment_number)
-                    segment_number += 1
-
-                encrypted_meta = aes128_cbc_encrypt(meta_key, zero_iv, bytes(meta_buffer))
-
-                out_f.write(encrypted_meta)
-                out_f.write(encrypted_data)
-
-                bytes_processed += len(data_chunk)
-                if progress_callback:
-                    progress_callback(bytes_processed, final_size)
+    except BaseException:
+        # Padding and the LIMG header are only appended, so cutting them off restores the input
+        if not use_temp and iso_path.stat().st_size > original_size:
+            os.truncate(iso_path, original_size)
+        raise
 
     finally:
         if temp_iso and temp_iso.exists():
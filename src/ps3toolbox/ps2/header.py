@@ -10,6 +10,24 @@ from ps3toolbox.core.keys import NPD_OMAC_KEY3
 from ps3toolbox.core.keys import SEGMENT_SIZE
 
 
+# Header field offsets
+_OFFSET_CONTENT_ID = 0x10
+_CONTENT_ID_SIZE = 0x30
+_OFFSET_WATERMARK = 0x40
+_OFFSET_FILENAME_HASH = 0x50
+_OFFSET_HEADER_HASH = 0x60
+_HEADER_HASH_END = 0x70
+_OFFSET_SEGMENT_SIZE = 0x84
+
+# Magic, version major/minor, NPD type, type
+_PREFIX = struct.Struct(">4sHHII")
+# Segment size, ISO size
+_SIZES = struct.Struct(">IQ")
+
+_WATERMARK = b"bucanero.com.ar\x00"
+_NPD_OMAC_KEY = bytes(kek ^ key for kek, key in zip(NPD_KEK, NPD_OMAC_KEY2, strict=True))
+
+
 class PS2Metadata(TypedDict):
     """PS2 Classics metadata structure."""
 
@@ -27,25 +45,18 @@ def build_ps2_header(content_id: str, filename: str, iso_size: int, npd_type: in
     """Build PS2 Classics header (0x4000 bytes)."""
     header = bytearray(SEGMENT_SIZE)
 
-    header[0x00:0x04] = b"PS2\x00"
-    struct.pack_into(">H", header, 0x04, 0x0001)
-    struct.pack_into(">H", header, 0x06, 0x0001)
-    struct.pack_into(">I", header, 0x08, npd_type)
-    struct.pack_into(">I", header, 0x0C, 0x0001)
-
-    cid_bytes = content_id.encode("ascii")[:0x30]
-    header[0x10 : 0x10 + len(cid_bytes)] = cid_bytes
+    _PREFIX.pack_into(header, 0x00, b"PS2\x00", 0x0001, 0x0001, npd_type, 0x0001)
 
-    struct.pack_into(">I", header, 0x84, SEGMENT_SIZE)
-    struct.pack_into(">Q", header, 0x88, iso_size)
+    cid_bytes = content_id.encode("ascii")[:_CONTENT_ID_SIZE]
+    header[_OFFSET_CONTENT_ID : _OFFSET_CONTENT_ID + len(cid_bytes)] = cid_bytes
 
-    header[0x40:0x50] = b"bucanero.com.ar\x00"
+    _SIZES.pack_into(header, _OFFSET_SEGMENT_SIZE, SEGMENT_SIZE, iso_size)
 
-    npd_omac_key = bytes(NPD_KEK[i] ^ NPD_OMAC_KEY2[i] for i in range(16))
+    header[_OFFSET_WATERMARK:_OFFSET_FILENAME_HASH] = _WATERMARK
 
-    buf = header[0x10:0x40] + filename.encode("ascii")
-    header[0x50:0x60] = calculate_omac(buf, NPD_OMAC_KEY3)
-    header[0x60:0x70] = calculate_omac(bytes(header[0x00:0x60]), npd_omac_key)
+    buf = header[_OFFSET_CONTENT_ID:_OFFSET_WATERMARK] + filename.encode("ascii")
+    header[_OFFSET_FILENAME_HASH:_OFFSET_HEADER_HASH] = calculate_omac(buf, NPD_OMAC_KEY3)
+    header[_OFFSET_HEADER_HASH:_HEADER_HASH_END] = calculate_omac(bytes(header[:_OFFSET_HEADER_HASH]), _NPD_OMAC_KEY)
 
     return bytes(header)
 
@@ -55,15 +66,18 @@ def parse_ps2_header(header: bytes) -> PS2Metadata:
     if header[0:4] != b"PS2\x00":
         raise ValueError("Invalid PS2 header magic")
 
+    magic, version_major, version_minor, npd_type, header_type = _PREFIX.unpack_from(header)
+    segment_size, iso_size = _SIZES.unpack_from(header, _OFFSET_SEGMENT_SIZE)
+
     return {
-        "magic": header[0:4].decode("ascii", errors="ignore"),
-        "version_major": struct.unpack(">H", header[0x04:0x06])[0],
-        "version_minor": struct.unpack(">H", header[0x06:0x08])[0],
-        "npd_type": struct.unpack(">I", header[0x08:0x0C])[0],
-        "type": struct.unpack(">I", header[0x0C:0x10])[0],
-        "content_id": header[0x10:0x40].decode("ascii", errors="ignore").rstrip("\x00"),
-        "segment_size": struct.unpack(">I", header[0x84:0x88])[0],
-        "iso_size": struct.unpack(">Q", header[0x88:0x90])[0],
+        "magic": magic.decode("ascii", errors="ignore"),
+        "version_major": version_major,
+        "version_minor": version_minor,
+        "npd_type": npd_type,
+        "type": header_type,
+        "content_id": header[_OFFSET_CONTENT_ID:_OFFSET_WATERMARK].decode("ascii", errors="ignore").rstrip("\x00"),
+        "segment_size": segment_size,
+        "iso_size": iso_size,
     }
 
 
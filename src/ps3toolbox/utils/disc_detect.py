@@ -1,8 +1,28 @@
 """Disc number detection from filenames."""
 
 import re
+from functools import lru_cache
 
 
+# Patterns to match disc numbers, tried in order
+_DISC_PATTERNS = tuple(
+    re.compile(pattern)
+    for pattern in (
+        r"disc[\s_-]*(\d)",  # disc 1, disc_1, disc-1, disc1
+        r"disk[\s_-]*(\d)",  # disk 1, disk_1, disk-1, disk1
+        r"cd[\s_-]*(\d)",  # cd 1, cd_1, cd-1, cd1
+        r"d[\s_-]*(\d)",  # d 1, d_1, d-1, d1
+        r"\(disc[\s_]*(\d)\)",  # (disc 1), (disc1)
+        r"\[disc[\s_]*(\d)\]",  # [disc 1], [disc1]
+        r"\(cd[\s_]*(\d)\)",  # (cd 1), (cd1)
+        r"\[cd[\s_]*(\d)\]",  # [cd 1], [cd1]
+        r"\(d[\s_]*(\d)\)",  # (d 1), (d1)
+        r"\[d[\s_]*(\d)\]",  # [d 1], [d1]
+    )
+)
+
+
+@lru_cache(maxsize=4096)
 def detect_disc_number(filename: str) -> int:
     """
     Detect disc number from filename.
@@ -21,24 +41,10 @@ def detect_disc_number(filename: str) -> int:
     Returns:
         Disc number (1-9), defaults to 1 if not detected
     """
-    # Patterns to match disc numbers
-    patterns = [
-        r"disc[\s_-]*(\d)",  # disc 1, disc_1, disc-1, disc1
-        r"disk[\s_-]*(\d)",  # disk 1, disk_1, disk-1, disk1
-        r"cd[\s_-]*(\d)",  # cd 1, cd_1, cd-1, cd1
-        r"d[\s_-]*(\d)",  # d 1, d_1, d-1, d1
-        r"\(disc[\s_]*(\d)\)",  # (disc 1), (disc1)
-        r"\[disc[\s_]*(\d)\]",  # [disc 1], [disc1]
-        r"\(cd[\s_]*(\d)\)",  # (cd 1), (cd1)
-        r"\[cd[\s_]*(\d)\]",  # [cd 1], [cd1]
-        r"\(d[\s_]*(\d)\)",  # (d 1), (d1)
-        r"\[d[\s_]*(\d)\]",  # [d 1], [d1]
-    ]
-
     filename_lower = filename.lower()
 
-    for pattern in patterns:
-        match = re.search(pattern, filename_lower)
+    for pattern in _DISC_PATTERNS:
+        match = pattern.search(filename_lower)
         if match:
             disc_num = int(match.group(1))
             if 1 <= disc_num <= 9:
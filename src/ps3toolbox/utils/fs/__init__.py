@@ -1,5 +1,6 @@
 """Filesystem provider abstraction for FTP and local operations."""
 
+from .provider import FileInfo
 from .provider import FilesystemProvider
 from .provider import FTPFilesystem
 from .provider import LocalFilesystem
@@ -7,6 +8,7 @@ from .provider import create_filesystem
 
 
 __all__ = [
+    "FileInfo",
     "FilesystemProvider",
     "LocalFilesystem",
     "FTPFilesystem",
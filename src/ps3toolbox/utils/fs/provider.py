@@ -1,21 +1,43 @@
 """Filesystem abstraction for local and FTP operations."""
 
 import asyncio
-import io
+import calendar
+import os
+import posixpath
+import queue
+import re
+import shutil
+import socket
+import stat
+import threading
+import time
 from abc import ABC
 from abc import abstractmethod
 from collections.abc import AsyncIterator
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import aclosing
+from contextlib import asynccontextmanager
 from dataclasses import dataclass
 from ftplib import FTP
+from ftplib import Error as FTPError
 from ftplib import all_errors
+from functools import lru_cache
+from functools import partial
 from pathlib import Path
 from pathlib import PurePosixPath
 from urllib.parse import urlparse
 
-import aiofiles
 
+__all__ = [
+    "FileInfo",
+    "FilesystemProvider",
+    "LocalFilesystem",
+    "FTPFilesystem",
+    "create_filesystem",
+]
 
-@dataclass
+
+@dataclass(slots=True)
 class FileInfo:
     """File information that works for both local and FTP."""
 
@@ -23,6 +45,380 @@ class FileInfo:
     name: str
     size: int
     is_dir: bool
+    # Modification time in nanoseconds since the epoch, 0 when the listing does not report it
+    mtime: int = 0
+
+
+# Buffer size for local file I/O; large sequential transfers dominate this workload
+LOCAL_IO_BUFSIZE = 1 << 20
+
+# Block size for FTP transfers; ftplib's 8 KiB default makes transfers CPU-bound on per-chunk overhead
+FTP_BLOCKSIZE = 1 << 20
+
+# Kernel socket buffer requested for FTP data connections
+FTP_SOCKET_BUFSIZE = 1 << 22
+
+# Maximum concurrent FTP sessions per provider
+FTP_POOL_SIZE = 4
+
+# Seconds a cached FTP directory listing stays valid
+FTP_LISTING_TTL = 30.0
+
+# Idle seconds after which a pooled FTP session is probed with NOOP before reuse
+FTP_KEEPALIVE_IDLE = 30.0
+
+# Errors meaning the session itself died, as opposed to an FTP error reply
+_CONNECTION_ERRORS = (EOFError, ConnectionError)
+
+# Replies a server sends for a transfer the client cut short (connection closed, aborted)
+_ABORT_REPLIES = ("426", "451")
+
+
+def _sync_read(path: str, start: int, length: int) -> bytes:
+    """Read a local file in one blocking call (run via asyncio.to_thread)."""
+    with open(path, "rb", buffering=LOCAL_IO_BUFSIZE) as f:
+        if start > 0:
+            f.seek(start)
+        if length > 0:
+            return f.read(length)
+        return f.read()
+
+
+def _scan_dir(path: str) -> list[FileInfo]:
+    """List a local directory in one blocking call (run via asyncio.to_thread).
+
+    os.scandir reports entry types from the directory read itself, so only
+    regular files need an extra stat() for their size and mtime.
+    """
+    items = []
+    try:
+        with os.scandir(path) as it:
+            for entry in it:
+                if entry.is_file():
+                    st = entry.stat()
+                    items.append(FileInfo(entry.path, entry.name, st.st_size, False, st.st_mtime_ns))
+                else:
+                    items.append(FileInfo(entry.path, entry.name, 0, entry.is_dir()))
+    except FileNotFoundError:
+        return []
+    return items
+
+
+def _sync_write(path: str, data: bytes) -> None:
+    """Write a local file in one blocking call (run via asyncio.to_thread)."""
+    with open(path, "wb", buffering=LOCAL_IO_BUFSIZE) as f:
+        f.write(data)
+
+
+def _copy_range(src_fd: int, dst_fd: int) -> bool:
+    """Copy a whole file in-kernel with copy_file_range, False if unsupported."""
+    if not hasattr(os, "copy_file_range"):
+        return False
+
+    copied = 0
+    try:
+        while n := os.copy_file_range(src_fd, dst_fd, 1 << 30):
+            copied += n
+    except OSError:
+        if copied:
+            raise
+        return False  # e.g. cross-filesystem copy on older kernels
+
+    return True
+
+
+def _sendfile(src_fd: int, dst_fd: int) -> bool:
+    """Copy a whole file in-kernel with sendfile, False if the platform refuses file targets."""
+    if not hasattr(os, "sendfile"):
+        return False
+
+    offset = 0
+    try:
+        while n := os.sendfile(dst_fd, src_fd, offset, 1 << 30):
+            offset += n
+    except OSError:
+        if offset:
+            raise
+        return False  # macOS only sends to sockets
+
+    return True
+
+
+def _sync_copy(src: str, dst: str) -> None:
+    """Copy a local file with its mode and times in one blocking call (run via asyncio.to_thread)."""
+    with open(src, "rb", buffering=LOCAL_IO_BUFSIZE) as fsrc, open(dst, "wb", buffering=LOCAL_IO_BUFSIZE) as fdst:
+        src_fd, dst_fd = fsrc.fileno(), fdst.fileno()
+        st = os.fstat(src_fd)
+        if not _copy_range(src_fd, dst_fd) and not _sendfile(src_fd, dst_fd):
+            shutil.copyfileobj(fsrc, fdst, LOCAL_IO_BUFSIZE)
+
+    os.chmod(dst, stat.S_IMODE(st.st_mode))
+    os.utime(dst, ns=(st.st_atime_ns, st.st_mtime_ns))
+
+
+class _TransferAborted(Exception):
+    """Raised from an ftplib callback to stop a transfer early."""
+
+
+def _offer(q: queue.Queue, item: object, stop: threading.Event) -> bool:
+    """Put item on a bounded queue, giving up (False) once stop is set."""
+    while not stop.is_set():
+        try:
+            q.put(item, timeout=0.1)
+            return True
+        except queue.Full:
+            pass
+    return False
+
+
+class _MVReader:
+    """File-like view over a bytes buffer whose reads are zero-copy memoryview slices."""
+
+    __slots__ = ("mv", "pos")
+
+    def __init__(self, data: bytes):
+        self.mv = memoryview(data)
+        self.pos = 0
+
+    def read(self, size: int = -1) -> memoryview:
+        end = len(self.mv) if size < 0 else self.pos + size
+        chunk = self.mv[self.pos : end]
+        self.pos += len(chunk)
+        return chunk
+
+    def seek(self, pos: int) -> None:
+        self.pos = pos
+
+
+class _PipeReader:
+    """File-like object that ftplib.storbinary reads while asyncio feeds it chunks."""
+
+    def __init__(self, maxsize: int = 4):
+        self._queue: queue.Queue[bytes | BaseException | None] = queue.Queue(maxsize)
+        self._pending = memoryview(b"")
+        self._eof = False
+        self._closed = threading.Event()
+
+    def feed(self, chunk: bytes | BaseException | None) -> bool:
+        """Queue a chunk, an exception to raise in the reader, or None for EOF.
+
+        Blocks while the queue is full; returns False once the reader has stopped.
+        """
+        return _offer(self._queue, chunk, self._closed)
+
+    def close(self) -> None:
+        """Mark the reading side as finished so feed() stops blocking."""
+        self._closed.set()
+
+    def read(self, size: int = -1) -> bytes:
+        while not self._pending and not self._eof:
+            chunk = self._queue.get()
+            if chunk is None:
+                self._eof = True
+            elif isinstance(chunk, BaseException):
+                raise chunk
+            else:
+                self._pending = memoryview(chunk)
+
+        if size < 0:
+            size = len(self._pending)
+        data = bytes(self._pending[:size])
+        self._pending = self._pending[size:]
+        return data
+
+
+class _TunedFTP(FTP):
+    """FTP client that enlarges kernel buffers on each data connection."""
+
+    def ntransfercmd(self, cmd, rest=None):
+        conn, size = super().ntransfercmd(cmd, rest)
+        for opt in (socket.SO_RCVBUF, socket.SO_SNDBUF):
+            try:
+                conn.setsockopt(socket.SOL_SOCKET, opt, FTP_SOCKET_BUFSIZE)
+            except OSError:
+                pass
+        return conn, size
+
+
+@lru_cache(maxsize=4096)
+def _pp(*parts: str) -> PurePosixPath:
+    """Parse an FTP path once; the same directories are joined and split over and over."""
+    return PurePosixPath(*parts)
+
+
+def _ftp_join(*parts: str) -> str:
+    return str(_pp(*parts))
+
+
+# String ops instead of PurePosixPath; trailing slashes are stripped to match its parent/name
+def _ftp_dirname(path: str) -> str:
+    return posixpath.dirname(path.rstrip("/") or path) or "."
+
+
+def _ftp_basename(path: str) -> str:
+    return posixpath.basename(path.rstrip("/"))
+
+
+def _ftp_stem(path: str) -> str:
+    return posixpath.splitext(_ftp_basename(path))[0]
+
+
+@lru_cache(maxsize=4096)
+def _strip_ftp_url(path: str) -> str:
+    """Strip FTP URL prefix if present, return just the path part."""
+    if path.startswith("ftp://"):
+        parsed = urlparse(path)
+        return parsed.path or "/"
+    return path
+
+
+# Unix-style LIST line: "-rw-r--r-- 1 owner group 12345 Jan 01 12:00 name"
+_LIST_LINE = re.compile(
+    r"^(?P<type>[-dl])\S{9}\S*\s+\d+\s+\S+\s+\S+\s+(?P<size>\d+)\s+"
+    r"\w{3}\s+\d{1,2}\s+(?:\d{1,2}:\d{2}|\d{4})\s(?P<name>.+)$"
+)
+
+
+def _parse_list_line(line: str) -> tuple[str, int, bool] | None:
+    """Parse a unix-style LIST line into (name, size, is_dir), or None if unrecognized."""
+    match = _LIST_LINE.match(line)
+    if not match:
+        return None
+
+    name = match["name"]
+    if match["type"] == "l":
+        name = name.split(" -> ", 1)[0]
+    return name, int(match["size"]), match["type"] == "d"
+
+
+def _mlsd_mtime(value: str) -> int:
+    """Convert an MLSD modify fact (YYYYMMDDHHMMSS[.sss] UTC) to nanoseconds, 0 if missing or malformed."""
+    try:
+        return calendar.timegm(time.strptime(value[:14], "%Y%m%d%H%M%S")) * 1_000_000_000
+    except ValueError:
+        return 0
+
+
+def _close_quietly(ftp: FTP) -> None:
+    """Close an FTP session without sending QUIT."""
+    try:
+        ftp.close()
+    except Exception:
+        pass
+
+
+class _Session:
+    """Pooled FTP connection and the single thread allowed to drive it.
+
+    ftplib objects are not thread-safe, so every command on a connection
+    runs on its own one-worker executor.
+    """
+
+    __slots__ = ("ftp", "executor", "last_activity")
+
+    def __init__(self, ftp: FTP, executor: ThreadPoolExecutor):
+        self.ftp = ftp
+        self.executor = executor
+        self.last_activity = 0.0
+
+    def run(self, fn, *args) -> asyncio.Future:
+        """Run fn(*args) on this connection's thread."""
+        return asyncio.get_running_loop().run_in_executor(self.executor, fn, *args)
+
+    def close(self) -> None:
+        """Close the connection without QUIT and stop its thread."""
+        _close_quietly(self.ftp)
+        self.executor.shutdown(wait=False)
+
+
+def _ftp_retrieve(ftp: FTP, path: str, callback, blocksize: int, start: int = 0, length: int = -1) -> None:
+    """Download path into callback, aborting the transfer once length bytes arrived.
+
+    A length of 0 or less reads to the end of the file. The callback may raise
+    _TransferAborted to stop early as well.
+    """
+    remaining = length if length > 0 else None
+
+    def _on_data(data: bytes) -> None:
+        nonlocal remaining
+        if remaining is not None:
+            data = data[:remaining]
+            remaining -= len(data)
+        callback(data)
+        if remaining == 0:
+            raise _TransferAborted
+
+    try:
+        ftp.retrbinary(f"RETR {path}", _on_data, blocksize, rest=start or None)
+    except _TransferAborted:
+        # Data connection is closed; collect the server's reply to the aborted transfer
+        try:
+            ftp.getresp()  # 226/225 when the server finished sending anyway
+        except FTPError as e:
+            if str(e)[:3] not in _ABORT_REPLIES:
+                _close_quietly(ftp)  # Out of sync, the pool will reconnect
+        except all_errors:
+            _close_quietly(ftp)
+
+
+def _discard_partial_upload(ftp: FTP, path: str) -> None:
+    """Collect the reply of an upload its source cut short and delete the truncated file."""
+    try:
+        ftp.getresp()
+    except FTPError:
+        pass  # 426/451 for the dropped data connection, the session is still in sync
+    except all_errors:
+        _close_quietly(ftp)  # Out of sync, the pool will reconnect
+        return
+
+    try:
+        ftp.delete(path)
+    except all_errors:
+        pass
+
+
+def _ftp_store(ftp: FTP, path: str, fp, blocksize: int = FTP_BLOCKSIZE) -> None:
+    """Upload fp to path, changing into the target directory first.
+
+    If fp raises _TransferAborted the partial file is removed before re-raising.
+    """
+    # Some servers (like PS3 dev_ntfs0) require CWD before STOR
+    # Split path into directory and filename
+    p = _pp(path)
+    directory = str(p.parent)
+    filename = p.name
+
+    try:
+        current_pwd = ftp.pwd()
+    except Exception:
+        current_pwd = "/"
+
+    try:
+        try:
+            # Try to change to the target directory
+            ftp.cwd(directory)
+        except all_errors:
+            # If CWD failed, try full path as fallback
+            ftp.storbinary(f"STOR {path}", fp, blocksize)
+            return
+
+        try:
+            ftp.storbinary(f"STOR {filename}", fp, blocksize)
+        except all_errors:
+            # Streams cannot be replayed, only retry buffered uploads
+            if not hasattr(fp, "seek"):
+                raise
+            fp.seek(0)
+            ftp.storbinary(f"STOR {path}", fp, blocksize)
+    except _TransferAborted:
+        _discard_partial_upload(ftp, path)
+        raise
+    finally:
+        if ftp.sock is not None:
+            try:
+                ftp.cwd(current_pwd)
+            except all_errors:
+                pass
 
 
 class FilesystemProvider(ABC):
@@ -53,6 +449,14 @@ class FilesystemProvider(ABC):
         """Write bytes to file."""
         pass
 
+    async def read_stream(self, path: str, start: int = 0, length: int = -1) -> AsyncIterator[bytes]:
+        """Read file bytes as a stream of chunks (optionally a range)."""
+        yield await self.read_bytes(path, start, length)
+
+    async def write_stream(self, path: str, chunks: AsyncIterator[bytes]) -> None:
+        """Write a stream of chunks to file."""
+        await self.write_bytes(path, b"".join([chunk async for chunk in chunks]))
+
     @abstractmethod
     async def copy_file(self, src: str, dst: str) -> None:
         """Copy file from src to dst."""
@@ -89,11 +493,44 @@ class FilesystemProvider(ABC):
         pass
 
 
+# String ops instead of Path, falling back to it for paths Path() would rewrite:
+# empty, doubled or trailing separators, "." components
+_UNNORMALIZED = re.compile(r"^$|//|/$|(?:^|/)\.(?:/|$)")
+
+
+def _local_join(*parts: str) -> str:
+    joined = os.path.join(*parts)
+    if os.altsep or _UNNORMALIZED.search(joined):
+        return str(Path(*parts))
+    return joined
+
+
+def _local_dirname(path: str) -> str:
+    if os.altsep or _UNNORMALIZED.search(path):
+        return str(Path(path).parent)
+    return os.path.dirname(path) or "."
+
+
+def _local_basename(path: str) -> str:
+    if os.altsep or _UNNORMALIZED.search(path):
+        return Path(path).name
+    return os.path.basename(path)
+
+
+def _local_stem(path: str) -> str:
+    return os.path.splitext(_local_basename(path))[0]
+
+
 class LocalFilesystem(FilesystemProvider):
     """Local filesystem provider."""
 
     def __init__(self, dry_run: bool = False):
         self.dry_run = dry_run
+        # Path helpers are pure; binding the functions skips method dispatch in hot loops
+        self.join_path = _local_join
+        self.dirname = _local_dirname
+        self.basename = _local_basename
+        self.stem = _local_stem
 
     async def exists(self, path: str) -> bool:
         return Path(path).exists()
@@ -102,40 +539,52 @@ class LocalFilesystem(FilesystemProvider):
         return Path(path).is_dir()
 
     async def list_dir(self, path: str) -> AsyncIterator[FileInfo]:
-        p = Path(path)
-        if not p.exists():
-            return
-
-        for item in p.iterdir():
-            yield FileInfo(
-                path=str(item),
-                name=item.name,
-                size=item.stat().st_size if item.is_file() else 0,
-                is_dir=item.is_dir(),
-            )
+        for item in await asyncio.to_thread(_scan_dir, path):
+            yield item
 
     async def read_bytes(self, path: str, start: int = 0, length: int = -1) -> bytes:
-        async with aiofiles.open(path, "rb") as f:
-            if start > 0:
-                await f.seek(start)
-            if length > 0:
-                return await f.read(length)
-            return await f.read()
+        return await asyncio.to_thread(_sync_read, path, start, length)
 
     async def write_bytes(self, path: str, data: bytes) -> None:
         if self.dry_run:
             return
 
-        async with aiofiles.open(path, "wb") as f:
-            await f.write(data)
+        await asyncio.to_thread(_sync_write, path, data)
 
-    async def copy_file(self, src: str, dst: str) -> None:
+    async def read_stream(self, path: str, start: int = 0, length: int = -1) -> AsyncIterator[bytes]:
+        f = await asyncio.to_thread(open, path, "rb", buffering=LOCAL_IO_BUFSIZE)
+        try:
+            if start > 0:
+                f.seek(start)
+
+            remaining = length if length > 0 else -1
+            while remaining != 0:
+                size = LOCAL_IO_BUFSIZE if remaining < 0 else min(remaining, LOCAL_IO_BUFSIZE)
+                chunk = await asyncio.to_thread(f.read, size)
+                if not chunk:
+                    break
+                if remaining > 0:
+                    remaining -= len(chunk)
+                yield chunk
+        finally:
+            f.close()
+
+    async def write_stream(self, path: str, chunks: AsyncIterator[bytes]) -> None:
         if self.dry_run:
             return
 
-        import shutil
+        f = await asyncio.to_thread(open, path, "wb", buffering=LOCAL_IO_BUFSIZE)
+        try:
+            async for chunk in chunks:
+                await asyncio.to_thread(f.write, chunk)
+        finally:
+            f.close()
+
+    async def copy_file(self, src: str, dst: str) -> None:
+        if self.dry_run:
+            return
 
-        await asyncio.to_thread(shutil.copy2, src, dst)
+        await asyncio.to_thread(_sync_copy, src, dst)
 
     async def mkdir(self, path: str) -> None:
         if self.dry_run:
@@ -150,76 +599,205 @@ class LocalFilesystem(FilesystemProvider):
         Path(src).rename(dst)
 
     def join_path(self, *parts: str) -> str:
-        return str(Path(*parts))
+        return _local_join(*parts)
 
     def dirname(self, path: str) -> str:
-        return str(Path(path).parent)
+        return _local_dirname(path)
 
     def basename(self, path: str) -> str:
-        return Path(path).name
+        return _local_basename(path)
 
     def stem(self, path: str) -> str:
-        return Path(path).stem
+        return _local_stem(path)
 
 
 class FTPFilesystem(FilesystemProvider):
     """FTP filesystem provider with safety for dry-run mode.
 
     Uses standard ftplib for maximum compatibility with PS3/older servers.
+    Keeps a small pool of sessions so independent operations run in parallel.
     """
 
-    def __init__(self, host: str, port: int = 21, user: str = "", password: str = "", dry_run: bool = False):
+    def __init__(
+        self,
+        host: str,
+        port: int = 21,
+        user: str = "",
+        password: str = "",
+        dry_run: bool = False,
+        blocksize: int = FTP_BLOCKSIZE,
+        pool_size: int = FTP_POOL_SIZE,
+    ):
         self.host = host
         self.port = port
         self.user = user or "anonymous"
         self.password = password or "anonymous@"
         self.dry_run = dry_run
-        self._client: FTP | None = None
+        self.blocksize = blocksize
+        self.pool_size = max(1, pool_size)
+        self._idle: asyncio.Queue[_Session] | None = None
+        self._slots: asyncio.Semaphore | None = None
+        # Streaming copies hold two sessions; capping them at pool_size // 2 keeps them from
+        # all holding a write session while waiting on each other for a read session
+        self._copy_pairs: asyncio.Semaphore | None = None
+        self._listing_cache: dict[str, tuple[float, dict[str, FileInfo]]] = {}
+        self._listing_ttl = FTP_LISTING_TTL
+        self.join_path = _ftp_join
+        self.dirname = _ftp_dirname
+        self.basename = _ftp_basename
+        self.stem = _ftp_stem
 
     def _normalize_path(self, path: str) -> str:
         """Strip FTP URL prefix if present, return just the path part."""
-        if path.startswith("ftp://"):
-            parsed = urlparse(path)
-            return parsed.path or "/"
-        return path
-
-    async def connect(self):
-        """Connect to FTP server."""
-        if self._client:
-            try:
-                await asyncio.to_thread(self._client.voidcmd, "NOOP")
-            except Exception:
+        return _strip_ftp_url(path)
+
+    def _cached_listing(self, path: str) -> dict[str, FileInfo] | None:
+        """Return the cached listing of a directory, keyed by name, if it has not expired."""
+        cached = self._listing_cache.get(path)
+        if cached is None:
+            return None
+        if time.monotonic() - cached[0] >= self._listing_ttl:
+            del self._listing_cache[path]
+            return None
+        return cached[1]
+
+    def _cached_stat(self, path: str) -> FileInfo | bool | None:
+        """Answer a lookup from cached listings without a round-trip.
+
+        Returns the entry (True for a cached directory itself), False when the
+        parent listing shows it is absent, or None when nothing is cached.
+        """
+        path = str(_pp(path))
+        if self._cached_listing(path) is not None:
+            return True
+
+        p = _pp(path)
+        if p.parent == p:
+            return None
+
+        listing = self._cached_listing(str(p.parent))
+        if listing is None:
+            return None
+        return listing.get(p.name, False)
+
+    def _invalidate(self, *paths: str) -> None:
+        """Drop cached listings affected by changes to the given paths."""
+        for path in paths:
+            path = str(_pp(path))
+            self._listing_cache.pop(str(_pp(path).parent), None)
+            for key in [k for k in self._listing_cache if k == path or k.startswith(path.rstrip("/") + "/")]:
+                del self._listing_cache[key]
+
+    def _open_connection(self) -> FTP:
+        """Open and log in a new FTP session (blocking)."""
+        ftp = _TunedFTP()
+        ftp.encoding = "latin-1"  # PS3 FTP servers use Latin-1 encoding
+        ftp.connect(self.host, self.port, timeout=30)
+        ftp.login(self.user, self.password)
+        # Set to binary mode for file transfers
+        ftp.voidcmd("TYPE I")
+        return ftp
+
+    async def _acquire(self, verify: bool = False) -> _Session:
+        """Take an idle session from the pool, opening one if none is usable.
+
+        Sessions used within FTP_KEEPALIVE_IDLE seconds are trusted without a
+        NOOP round-trip unless verify is set; callers that can retry use _run().
+        """
+        if self._idle is None:
+            self._idle = asyncio.Queue()
+            self._slots = asyncio.Semaphore(self.pool_size)
+
+        await self._slots.acquire()
+        try:
+            while not self._idle.empty():
+                session = self._idle.get_nowait()
+                if session.ftp.sock is None:
+                    session.close()  # Closed after an aborted transfer
+                    continue
+                if not verify and time.monotonic() - session.last_activity < FTP_KEEPALIVE_IDLE:
+                    return session
                 try:
-                    self._client.close()
+                    await session.run(session.ftp.voidcmd, "NOOP")
+                    return session
                 except Exception:
-                    pass
-                self._client = None
+                    session.close()
 
-        if self._client is None:
+            executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="ftp")
+            try:
+                ftp = await asyncio.get_running_loop().run_in_executor(executor, self._open_connection)
+            except BaseException:
+                executor.shutdown(wait=False)
+                raise
+            return _Session(ftp, executor)
+        except BaseException:
+            self._slots.release()
+            raise
+
+    def _release(self, session: _Session, broken: bool = False) -> None:
+        """Return a session to the pool, or drop it if the connection failed."""
+        if broken:
+            session.close()
+        else:
+            session.last_activity = time.monotonic()
+            self._idle.put_nowait(session)
+        self._slots.release()
+
+    @asynccontextmanager
+    async def _pool_ctx(self, verify: bool = False) -> AsyncIterator[_Session]:
+        """Borrow a pooled session for the duration of the block."""
+        session = await self._acquire(verify)
+        try:
+            yield session
+        except (OSError, EOFError):
+            self._release(session, broken=True)
+            raise
+        except BaseException:
+            self._release(session)
+            raise
+        else:
+            self._release(session)
+
+    async def _run(self, fn, *args, idempotent: bool = False):
+        """Run fn(ftp, *args) on a pooled session's thread.
+
+        For idempotent calls a session that turns out to be dead is dropped and
+        the call retried once on a fresh one. Other calls may already have reached
+        the server, so they check the session with NOOP up front instead.
+        """
+        if idempotent:
+            try:
+                async with self._pool_ctx() as session:
+                    return await session.run(fn, session.ftp, *args)
+            except _CONNECTION_ERRORS:
+                pass
 
-            def _connect():
-                ftp = FTP()
-                ftp.encoding = "latin-1"  # PS3 FTP servers use Latin-1 encoding
-                ftp.connect(self.host, self.port, timeout=30)
-                ftp.login(self.user, self.password)
-                # Set to binary mode for file transfers
-                ftp.voidcmd("TYPE I")
-                return ftp
+        async with self._pool_ctx(verify=True) as session:
+            return await session.run(fn, session.ftp, *args)
 
-            self._client = await asyncio.to_thread(_connect)
+    async def connect(self):
+        """Connect to FTP server."""
+        async with self._pool_ctx():
+            pass
 
     async def disconnect(self):
         """Disconnect from FTP server."""
-        if self._client:
+        if self._idle is None:
+            return
 
-            def _disconnect():
-                try:
-                    self._client.quit()
-                except all_errors:
-                    pass  # Ignore errors during disconnect
+        sessions = []
+        while not self._idle.empty():
+            sessions.append(self._idle.get_nowait())
+
+        def _quit(ftp: FTP):
+            try:
+                ftp.quit()
+            except all_errors:
+                pass  # Ignore errors during disconnect
 
-            await asyncio.to_thread(_disconnect)
-            self._client = None
+        await asyncio.gather(*(session.run(_quit, session.ftp) for session in sessions))
+        for session in sessions:
+            session.close()
 
     async def __aenter__(self):
         await self.connect()
@@ -229,65 +807,103 @@ class FTPFilesystem(FilesystemProvider):
         await self.disconnect()
 
     async def exists(self, path: str) -> bool:
-        await self.connect()
         path = self._normalize_path(path)
 
-        def _exists():
+        cached = self._cached_stat(path)
+        if cached is not None:
+            return cached is not False
+
+        def _exists(client: FTP):
             try:
-                self._client.size(path)
+                client.size(path)
                 return True
-            except Exception:
+            except FTPError:
                 try:
-                    self._client.cwd(path)
+                    client.cwd(path)
                     return True
-                except Exception:
+                except FTPError:
                     return False
 
-        return await asyncio.to_thread(_exists)
+        return await self._run(_exists, idempotent=True)
 
     async def is_dir(self, path: str) -> bool:
-        await self.connect()
         path = self._normalize_path(path)
 
-        def _is_dir():
+        cached = self._cached_stat(path)
+        if cached is not None:
+            return cached is True or (cached is not False and cached.is_dir)
+
+        def _is_dir(client: FTP):
             try:
-                current = self._client.pwd()
-                self._client.cwd(path)
-                self._client.cwd(current)
+                current = client.pwd()
+                client.cwd(path)
+                client.cwd(current)
                 return True
-            except Exception:
+            except FTPError:
                 return False
 
-        return await asyncio.to_thread(_is_dir)
+        return await self._run(_is_dir, idempotent=True)
 
     async def list_dir(self, path: str) -> AsyncIterator[FileInfo]:
-        await self.connect()
         path = self._normalize_path(path)
 
-        def _list_dir():
+        def _list_dir(client: FTP):
             items = []
+            base = _pp(path)
             # Try MLSD first (modern listing)
             try:
-                for name, facts in self._client.mlsd(path):
+                for name, facts in client.mlsd(path):
                     if name in (".", ".."):
                         continue
 
-                    full_path = str(PurePosixPath(path) / name)
+                    full_path = str(base / name)
                     items.append(
                         FileInfo(
                             path=full_path,
                             name=name,
                             size=int(facts.get("size", 0)),
                             is_dir=facts.get("type") == "dir",
+                            mtime=_mlsd_mtime(facts.get("modify", "")),
                         )
                     )
                 return items
-            except Exception:
-                # MLSD not supported, fall back to NLST
+            except FTPError:
+                # MLSD not supported, fall back to LIST
                 pass
 
-            # Fall back to NLST + SIZE for older servers
-            listings = self._client.nlst(path)
+            # Fall back to LIST for older servers, sizes come in the same response
+            lines: list[str] = []
+            client.retrlines(f"LIST {path}", lines.append)
+
+            unparsed = False
+            for line in lines:
+                if not line or line.startswith("total "):
+                    continue
+
+                parsed = _parse_list_line(line)
+                if parsed is None:
+                    unparsed = True
+                    continue
+
+                name, size, is_dir = parsed
+                if name in (".", ".."):
+                    continue
+
+                items.append(
+                    FileInfo(
+                        path=str(base / name),
+                        name=name,
+                        size=size,
+                        is_dir=is_dir,
+                    )
+                )
+
+            if not unparsed:
+                return items
+
+            # Unrecognized LIST format, use NLST + SIZE for the entries we missed
+            known = {item.name for item in items}
+            listings = client.nlst(path)
 
             for listing in listings:
                 if listing in (".", ".."):
@@ -297,15 +913,18 @@ class FTPFilesystem(FilesystemProvider):
                 # If it's a full path, extract the basename
                 if "/" in listing:
                     full_path = listing
-                    name = PurePosixPath(listing).name
+                    name = _pp(listing).name
                 else:
                     name = listing
-                    full_path = str(PurePosixPath(path) / name)
+                    full_path = str(base / name)
+
+                if name in known:
+                    continue
 
                 try:
-                    size = self._client.size(full_path)
+                    size = client.size(full_path)
                     is_dir = False
-                except Exception:
+                except FTPError:
                     # SIZE failed, assume it's a directory
                     size = 0
                     is_dir = True
@@ -321,127 +940,197 @@ class FTPFilesystem(FilesystemProvider):
 
             return items
 
-        items = await asyncio.to_thread(_list_dir)
-        for item in items:
+        key = str(_pp(path))
+        listing = self._cached_listing(key)
+        if listing is None:
+            listing = {item.name: item for item in await self._run(_list_dir, idempotent=True)}
+            self._listing_cache[key] = (time.monotonic(), listing)
+
+        for item in listing.values():
             yield item
 
     async def read_bytes(self, path: str, start: int = 0, length: int = -1) -> bytes:
-        await self.connect()
         path = self._normalize_path(path)
 
-        def _read():
-            buffer = io.BytesIO()
-            if start > 0:
-                self._client.sendcmd(f"REST {start}")
-
-            self._client.retrbinary(f"RETR {path}", buffer.write)
-            data = buffer.getvalue()
-
-            if length > 0:
-                return data[:length]
-            return data
+        def _read(client: FTP):
+            buffer = bytearray()
+            _ftp_retrieve(client, path, buffer.extend, self.blocksize, start, length)
+            return bytes(buffer)
 
-        return await asyncio.to_thread(_read)
+        return await self._run(_read, idempotent=True)
 
     async def write_bytes(self, path: str, data: bytes) -> None:
         if self.dry_run:
             return
 
-        await self.connect()
         path = self._normalize_path(path)
 
-        def _write():
-            buffer = io.BytesIO(data)
+        try:
+            await self._run(lambda client: _ftp_store(client, path, _MVReader(data), self.blocksize))
+        finally:
+            self._invalidate(path)
+
+    async def read_stream(self, path: str, start: int = 0, length: int = -1) -> AsyncIterator[bytes]:
+        """Stream a download through a bounded queue instead of buffering the whole file.
+
+        The stream holds a pooled session until it is exhausted or closed, so callers
+        that stop early must aclose() it (e.g. with contextlib.aclosing).
+        """
+        path = self._normalize_path(path)
+        chunks: queue.Queue[bytes | BaseException | None] = queue.Queue(maxsize=4)
+        stop = threading.Event()
 
-            # Some servers (like PS3 dev_ntfs0) require CWD before STOR
-            # Split path into directory and filename
-            p = PurePosixPath(path)
-            directory = str(p.parent)
-            filename = p.name
+        def _on_data(data: bytes) -> None:
+            if not _offer(chunks, data, stop):
+                raise _TransferAborted
 
+        def _retr(client: FTP):
+            try:
+                _ftp_retrieve(client, path, _on_data, self.blocksize, start, length)
+            except BaseException as e:
+                _offer(chunks, e, stop)
+                raise  # Lets _release_after drop a broken connection
+            else:
+                _offer(chunks, None, stop)
+
+        session = await self._acquire(verify=True)
+        transfer = session.run(_retr, session.ftp)
+        # Released on the transfer's completion rather than by _pool_ctx, whose own generator
+        # may already be finalized when asyncio closes an abandoned stream at shutdown
+        transfer.add_done_callback(partial(self._release_after, session))
+        loop = asyncio.get_running_loop()
+        try:
+            while True:
+                item = await loop.run_in_executor(None, chunks.get)
+                if item is None:
+                    break
+                if isinstance(item, BaseException):
+                    raise item
+                yield item
+        finally:
+            stop.set()
             try:
-                current_pwd = self._client.pwd()
-            except Exception:
-                current_pwd = "/"
+                chunks.put_nowait(None)  # Release a get() orphaned by cancellation
+            except queue.Full:
+                pass
+            # Wait for the thread without re-raising its error; if this is cancelled the session is still released
+            await asyncio.wait([transfer])
+
+    def _release_after(self, session: _Session, transfer: asyncio.Future) -> None:
+        """Return a streaming transfer's session once its thread has finished."""
+        error = None if transfer.cancelled() else transfer.exception()
+        self._release(session, broken=isinstance(error, (OSError, EOFError)))
+
+    async def write_stream(self, path: str, chunks: AsyncIterator[bytes]) -> None:
+        """Upload chunks as they arrive instead of joining them in memory first."""
+        if self.dry_run:
+            return
+
+        path = self._normalize_path(path)
+        chunks = aiter(chunks)
+        # Wait for data before sending STOR so a source that fails up front leaves no empty file
+        pending = await anext(chunks, None)
+        reader = _PipeReader()
 
+        def _store(client: FTP):
             try:
-                # Try to change to the target directory
-                self._client.cwd(directory)
-                self._client.storbinary(f"STOR {filename}", buffer)
-            except all_errors:
-                # If CWD failed, try full path as fallback
-                buffer.seek(0)
-                self._client.storbinary(f"STOR {path}", buffer)
+                _ftp_store(client, path, reader, self.blocksize)
             finally:
+                reader.close()
+
+        async with self._pool_ctx(verify=True) as session:
+            loop = asyncio.get_running_loop()
+            transfer = session.run(_store, session.ftp)
+            try:
+                while pending is not None:
+                    if not await loop.run_in_executor(None, reader.feed, pending):
+                        break  # Upload stopped early, its error surfaces below
+                    pending = await anext(chunks, None)
+                await loop.run_in_executor(None, reader.feed, None)
+            except BaseException:
+                # The source failed: cut the upload short and re-raise the source's error
+                await loop.run_in_executor(None, reader.feed, _TransferAborted())
                 try:
-                    self._client.cwd(current_pwd)
-                except all_errors:
+                    await transfer
+                except _TransferAborted:
                     pass
-
-        await asyncio.to_thread(_write)
+                raise
+            else:
+                await transfer
+            finally:
+                self._invalidate(path)
 
     async def copy_file(self, src: str, dst: str) -> None:
-        """Copy file within FTP server (read then write)."""
+        """Copy file within FTP server, downloading and uploading on two sessions at once."""
         if self.dry_run:
             return
 
-        data = await self.read_bytes(src)
-        await self.write_bytes(dst, data)
+        if self.pool_size < 2:
+            data = await self.read_bytes(src)
+            await self.write_bytes(dst, data)
+            return
+
+        if self._copy_pairs is None:
+            self._copy_pairs = asyncio.Semaphore(self.pool_size // 2)
+
+        async with self._copy_pairs, aclosing(self.read_stream(src)) as source:
+            await self.write_stream(dst, source)
 
     async def mkdir(self, path: str) -> None:
         if self.dry_run:
             return
 
-        await self.connect()
         path = self._normalize_path(path)
 
-        def _mkdir():
+        def _mkdir(client: FTP):
             try:
-                self._client.mkd(path)
+                client.mkd(path)
             except all_errors:
                 # Try CWD approach if full path fails
                 try:
-                    p = PurePosixPath(path)
+                    p = _pp(path)
                     directory = str(p.parent)
                     name = p.name
 
                     try:
-                        current_pwd = self._client.pwd()
+                        current_pwd = client.pwd()
                     except all_errors:
                         current_pwd = "/"
 
-                    self._client.cwd(directory)
-                    self._client.mkd(name)
-                    self._client.cwd(current_pwd)
+                    client.cwd(directory)
+                    client.mkd(name)
+                    client.cwd(current_pwd)
                 except all_errors:
                     pass  # Ignore if already exists or really fails
 
-        await asyncio.to_thread(_mkdir)
+        try:
+            await self._run(_mkdir)
+        finally:
+            self._invalidate(path)
 
     async def rename(self, src: str, dst: str) -> None:
         if self.dry_run:
             return
 
-        await self.connect()
         src = self._normalize_path(src)
         dst = self._normalize_path(dst)
 
-        def _rename():
-            self._client.rename(src, dst)
-
-        await asyncio.to_thread(_rename)
+        try:
+            await self._run(lambda client: client.rename(src, dst))
+        finally:
+            self._invalidate(src, dst)
 
     def join_path(self, *parts: str) -> str:
-        return str(PurePosixPath(*parts))
+        return _ftp_join(*parts)
 
     def dirname(self, path: str) -> str:
-        return str(PurePosixPath(path).parent)
+        return _ftp_dirname(path)
 
     def basename(self, path: str) -> str:
-        return PurePosixPath(path).name
+        return _ftp_basename(path)
 
     def stem(self, path: str) -> str:
-        return PurePosixPath(path).stem
+        return _ftp_stem(path)
 
 
 def create_filesystem(path: str, dry_run: bool = False) -> FilesystemProvider:
@@ -1,5 +1,6 @@
 """Progress reporting utilities."""
 
+import time
 from typing import Protocol
 
 from rich.progress import Progress
@@ -15,21 +16,36 @@ class ProgressCallback(Protocol):
 class ConsoleProgress:
     """Console progress bar using rich."""
 
+    # Minimum seconds between updates forwarded to rich
+    UPDATE_INTERVAL = 1 / 30
+
     def __init__(self, description: str):
         self.description = description
         self.progress: Progress | None = None
         self.task_id: TaskID | None = None
+        self._last_update = 0.0
 
     def start(self, total: int) -> None:
         """Start progress tracking."""
-        self.progress = Progress()
+        self.progress = Progress(refresh_per_second=10)
         self.progress.start()
         self.task_id = self.progress.add_task(self.description, total=total)
+        self._last_update = 0.0
 
     def update(self, current: int, total: int) -> None:
-        """Update progress to current position."""
-        if self.progress and self.task_id is not None:
-            self.progress.update(self.task_id, completed=current)
+        """Update progress to current position.
+
+        Called per chunk, so updates are throttled; the final one always goes through.
+        """
+        if not self.progress or self.task_id is None:
+            return
+
+        now = time.monotonic()
+        if now - self._last_update < self.UPDATE_INTERVAL and current < total:
+            return
+
+        self._last_update = now
+        self.progress.update(self.task_id, completed=current)
 
     def finish(self) -> None:
         """Finish and close progress bar."""
@@ -1,21 +1,56 @@
 """File and input validation utilities."""
 
 import os
+import time
+from collections.abc import Collection
+from collections.abc import Iterable
+from functools import lru_cache
 from pathlib import Path
 
 from ps3toolbox.utils.errors import InsufficientSpaceError
 
 
-def validate_input_file(path: Path, extensions: list[str]) -> None:
-    """Validate input file exists and has correct extension."""
+# Seconds a free-space reading is reused across batch checks
+DISK_SPACE_TTL = 2.0
+
+
+@lru_cache(maxsize=32)
+def _lower_set(extensions: tuple[str, ...] | frozenset[str]) -> frozenset[str]:
+    """Lowercased lookup set for an extension list, built once per distinct list."""
+    return frozenset(ext.lower() for ext in extensions)
+
+
+def _allowed_extensions(extensions: Collection[str]) -> frozenset[str]:
+    if isinstance(extensions, frozenset):
+        return _lower_set(extensions)
+    return _lower_set(tuple(extensions))
+
+
+def validate_input_file(path: Path, extensions: Collection[str]) -> None:
+    """Validate input file exists and has correct extension.
+
+    Batch callers can pass a prebuilt frozenset to skip the conversion.
+    """
     if not path.exists():
         raise FileNotFoundError(f"Input file not found: {path}")
 
     if not path.is_file():
         raise ValueError(f"Path is not a file: {path}")
 
-    if extensions and path.suffix.lower() not in [ext.lower() for ext in extensions]:
-        raise ValueError(f"Invalid file extension. Expected one of: {extensions}")
+    allowed = _allowed_extensions(extensions)
+    if allowed and path.suffix.lower() not in allowed:
+        raise ValueError(f"Invalid file extension. Expected one of: {', '.join(sorted(extensions))}")
+
+
+def validate_input_files(paths: Iterable[Path], extensions: Collection[str]) -> list[Path]:
+    """Return the paths that are existing files with an allowed extension.
+
+    Batch counterpart of validate_input_file: the extension set is built once
+    and each path costs a single suffix lookup and stat. No extensions means
+    any file is accepted.
+    """
+    allowed = _allowed_extensions(extensions)
+    return [path for path in paths if (not allowed or path.suffix.lower() in allowed) and path.is_file()]
 
 
 def validate_output_path(path: Path, overwrite: bool = False) -> None:
@@ -30,10 +65,16 @@ def validate_output_path(path: Path, overwrite: bool = False) -> None:
         raise PermissionError(f"No write permission for directory: {path.parent}")
 
 
+@lru_cache(maxsize=16)
+def _available_bytes(directory: str, bucket: int) -> int:
+    """Free bytes for directory; bucket changes every DISK_SPACE_TTL seconds to expire entries."""
+    stat = os.statvfs(directory)
+    return stat.f_bavail * stat.f_frsize
+
+
 def check_disk_space(path: Path, required_bytes: int) -> bool:
     """Check if sufficient disk space is available."""
-    stat = os.statvfs(path.parent)
-    available_bytes = stat.f_bavail * stat.f_frsize
+    available_bytes = _available_bytes(str(path.parent), int(time.monotonic() / DISK_SPACE_TTL))
 
     if available_bytes < required_bytes:
         raise InsufficientSpaceError(
@@ -0,0 +1,106 @@
+"""In-memory filesystem fake for organizer tests."""
+
+from collections import Counter
+
+from ps3toolbox.utils.fs import FileInfo
+
+
+# Plain string splits; test paths are clean POSIX paths, so pathlib's normalization is not needed
+def _dirname(path: str) -> str:
+    return path.rpartition("/")[0] or "/"
+
+
+def _basename(path: str) -> str:
+    return path.rpartition("/")[2]
+
+
+def _stem(path: str) -> str:
+    name = _basename(path)
+    dot = name.rfind(".")
+    return name[:dot] if dot > 0 else name
+
+
+def _join(*parts: str) -> str:
+    return "/".join(parts)
+
+
+class _AsyncIter:
+    """Async iterator over a prebuilt list, so listings never suspend per entry."""
+
+    def __init__(self, items: tuple[FileInfo, ...]):
+        self._items = iter(items)
+
+    def __aiter__(self) -> "_AsyncIter":
+        return self
+
+    async def __anext__(self) -> FileInfo:
+        try:
+            return next(self._items)
+        except StopIteration:
+            raise StopAsyncIteration from None
+
+
+class FakeFS:
+    """
+    Minimal stand-in for LocalFilesystem backed by a set of file paths.
+
+    Directories are implied by the files they contain. Every async call is
+    counted in ``calls`` by method name, so tests can assert on them without
+    going through mock call recording. Listings are built once per folder and
+    reused until a write changes the tree. Entries are listed in the order
+    they were added, like an unsorted directory read.
+    """
+
+    def __init__(self, files: tuple[str, ...] | list[str] = ()):
+        # Dicts as insertion-ordered sets
+        self.files: dict[str, None] = {}
+        self.dirs: dict[str, None] = {}
+        self.calls: Counter[str] = Counter()
+        self._listings: dict[str, tuple[FileInfo, ...]] = {}
+        for path in files:
+            self._add_file(path)
+
+    def _add_dir(self, path: str) -> None:
+        self._listings.clear()
+        while path not in self.dirs:
+            self.dirs[path] = None
+            path = self.dirname(path)
+
+    def _add_file(self, path: str) -> None:
+        self._listings.clear()
+        self.files[path] = None
+        self._add_dir(self.dirname(path))
+
+    async def exists(self, path: str) -> bool:
+        self.calls["exists"] += 1
+        return path in self.files or path in self.dirs
+
+    async def mkdir(self, path: str) -> None:
+        self.calls["mkdir"] += 1
+        self._add_dir(path)
+
+    async def rename(self, src: str, dst: str) -> None:
+        self.calls["rename"] += 1
+        self.files.pop(src, None)
+        self._listings.clear()
+        self._add_file(dst)
+
+    async def copy_file(self, src: str, dst: str) -> None:
+        self.calls["copy_file"] += 1
+        self._add_file(dst)
+
+    def list_dir(self, path: str) -> _AsyncIter:
+        self.calls["list_dir"] += 1
+        entries = self._listings.get(path)
+        if entries is None:
+            dirs = (child for child in self.dirs if child != path and _dirname(child) == path)
+            files = (child for child in self.files if _dirname(child) == path)
+            entries = tuple(FileInfo(path=child, name=_basename(child), size=0, is_dir=True) for child in dirs)
+            entries += tuple(FileInfo(path=child, name=_basename(child), size=0, is_dir=False) for child in files)
+            self._listings[path] = entries
+        return _AsyncIter(entries)
+
+    join_path = staticmethod(_join)
+    dirname = staticmethod(_dirname)
+    basename = staticmethod(_basename)
+    stem = staticmethod(_stem)
@@ -52,3 +52,38 @@ def test_info_help(runner):
     result = runner.invoke(cli, ["info", "--help"])
     assert result.exit_code == 0
     assert "information" in result.output
+
+
+def test_encrypt_rejects_wrong_extension(runner, tmp_path):
+    """Test encrypt lists the accepted extensions when given another file type."""
+    text_file = tmp_path / "foo.txt"
+    text_file.write_text("not an iso")
+
+    result = runner.invoke(cli, ["encrypt", str(text_file)])
+
+    assert result.exit_code != 0
+    assert "Invalid file extension. Expected one of: .iso" in result.output
+    assert "frozenset" not in result.output
+
+
+def test_batch_encrypt_skips_directory_matches(runner, tmp_path):
+    """Test batch-encrypt finds no ISOs when the pattern only matches directories."""
+    (tmp_path / "folder.iso").mkdir()
+
+    result = runner.invoke(cli, ["batch-encrypt", str(tmp_path)])
+
+    assert result.exit_code == 0
+    assert "No ISO files found" in result.output
+
+
+def test_batch_encrypt_honours_custom_pattern(runner, tmp_path):
+    """Test files matched by --pattern are used whatever their extension."""
+    (tmp_path / "game.img").write_bytes(b"image")
+    (tmp_path / "game.bin.enc").write_bytes(b"already encrypted")
+    (tmp_path / "folder.img").mkdir()
+
+    result = runner.invoke(cli, ["batch-encrypt", str(tmp_path), "--pattern", "*.img"])
+
+    assert result.exit_code == 0
+    assert "Found 1 ISO file(s)" in result.output
+    assert "Skipping game.img" in result.output
@@ -1,6 +1,7 @@
 """Unit tests for cover sync functionality."""
 
-from pathlib import Path
+import asyncio
+import json
 from unittest.mock import AsyncMock
 from unittest.mock import MagicMock
 from unittest.mock import patch
@@ -12,8 +13,19 @@ from ps3toolbox.games.metadata import RomDatabase
 from ps3toolbox.games.metadata import SerialResolver
 from ps3toolbox.games.metadata import clean_game_name
 from ps3toolbox.games.metadata import extract_serial_from_filename
+from ps3toolbox.games.scan_cache import ScanCache
+from ps3toolbox.games.scanner import GameFile
 from ps3toolbox.games.scanner import GameScanner
 from ps3toolbox.utils.fs import LocalFilesystem
+from tests.support.fake_fs import FakeFS
+
+
+@pytest.fixture(autouse=True)
+def cache_home(tmp_path, monkeypatch):
+    """Keep ROM database caches out of the real user cache folder."""
+    cache_home = tmp_path / "cache"
+    monkeypatch.setenv("XDG_CACHE_HOME", str(cache_home))
+    return cache_home
 
 
 class TestSerialExtraction:
@@ -84,6 +96,41 @@ class TestRomDatabase:
         result = sample_db.find_serial("Crash Bandicoot", region="Europe", threshold=75.0)
         assert result is None  # Europe version has no serial
 
+    def test_load_reuses_cache(self, sample_db, tmp_path, cache_home):
+        """Test a second load comes from the user cache until the TSV changes."""
+        db_file = tmp_path / "test.tsv"
+        assert len(list((cache_home / "ps3toolbox").glob("romdb-*.json"))) == 1
+        assert not list(tmp_path.glob("test.tsv?*"))
+
+        with patch("ps3toolbox.games.metadata.clean_game_name") as mock_clean:
+            cached = RomDatabase()
+            cached.load_from_tsv(db_file)
+        mock_clean.assert_not_called()
+        assert cached.find_serial("Final Fantasy VII", region="USA") == sample_db.find_serial(
+            "Final Fantasy VII", region="USA"
+        )
+
+        db_file.write_text("PS2\tUSA\tGran Turismo 4 (SLUS-21001)\tgt4.zip\t1000\n")
+        reloaded = RomDatabase()
+        reloaded.load_from_tsv(db_file)
+        assert len(reloaded) == 1
+
+    def test_load_ignores_malformed_cache(self, sample_db, tmp_path, cache_home):
+        """Test a cache with unexpected keys or types is rebuilt from the TSV."""
+        (cache_file,) = (cache_home / "ps3toolbox").glob("romdb-*.json")
+        state = json.loads(cache_file.read_text())
+        state["serials"] = [{"__class__": "os.system"}] * len(state["serials"])
+        state["_choices"] = "injected"
+        cache_file.write_text(json.dumps(state))
+
+        db = RomDatabase()
+        db.load_from_tsv(tmp_path / "test.tsv")
+
+        assert db.serials == sample_db.serials
+        assert db.find_serial("Final Fantasy VII", region="USA") == sample_db.find_serial(
+            "Final Fantasy VII", region="USA"
+        )
+
 
 @pytest.mark.asyncio
 class TestCoverDownloader:
@@ -178,6 +225,62 @@ class TestCoverDownloader:
             assert source == "libretro"
             assert url  # URL should be present
 
+    async def test_download_cover_prefers_first_source(self):
+        """Test sources are fetched concurrently but the highest-priority hit wins."""
+        downloader = CoverDownloader(max_concurrent=2)
+        started = []
+
+        async def mock_fetch(url):
+            started.append(url)
+            # The preferred source answers last
+            await asyncio.sleep(0.01 if "default" in url else 0)
+            return url.encode()
+
+        with patch.object(downloader, "_fetch", side_effect=mock_fetch):
+            await downloader.start()
+            result = await downloader.download_cover("PS2", "SLUS-21001", "Gran Turismo 4", resize=None)
+            await downloader.close()
+
+        assert result is not None
+        assert result[1] == "xlenore-2d"
+        assert len(started) == 3
+
+    async def test_fetch_retries_server_errors(self):
+        """Test 5xx responses are retried with backoff before giving up on a URL."""
+        downloader = CoverDownloader(max_concurrent=2)
+        statuses = iter([503, 500, 200])
+
+        def mock_get_side_effect(*args, **kwargs):
+            mock_response = AsyncMock()
+            mock_response.status = next(statuses)
+            mock_response.read = AsyncMock(return_value=b"retried_image")
+            async_cm = AsyncMock()
+            async_cm.__aenter__.return_value = mock_response
+            return async_cm
+
+        with (
+            patch("aiohttp.ClientSession.get", side_effect=mock_get_side_effect),
+            patch("ps3toolbox.covers.downloader.RETRY_BACKOFF", 0),
+        ):
+            await downloader.start()
+            data = await downloader._fetch("https://example.com/cover.png")
+            await downloader.close()
+
+        assert data == b"retried_image"
+
+    async def test_start_reuses_one_session(self):
+        """Test the downloader keeps a single pooled session across starts."""
+        downloader = CoverDownloader(max_concurrent=3)
+
+        await downloader.start()
+        session = downloader.session
+        await downloader.start()
+
+        assert downloader.session is session
+        assert session.connector.limit == 3
+        assert session.connector.limit_per_host == 3
+        await downloader.close()
+
 
 @pytest.mark.asyncio
 class TestGameScanner:
@@ -185,34 +288,9 @@ class TestGameScanner:
 
     async def test_scan_ps2_games(self):
         """Test scanning PS2 ISO files."""
-        # Mock filesystem
-        mock_fs = AsyncMock(spec=LocalFilesystem)
-
-        # Mock directory structure
-        async def mock_list_dir_impl(path):
-            if path == "/games":
-                # Root has PS2ISO folder
-                folder = MagicMock()
-                folder.name = "PS2ISO"
-                folder.path = "/games/PS2ISO"
-                folder.is_dir = True
-                yield folder
-            elif path == "/games/PS2ISO":
-                # PS2ISO has one game
-                file = MagicMock()
-                file.name = "game.iso"
-                file.path = "/games/PS2ISO/game.iso"
-                file.is_dir = False
-                yield file
-
-        # Make list_dir return the async generator
-        mock_fs.list_dir = mock_list_dir_impl
-        mock_fs.dirname = lambda p: str(Path(p).parent)
-        mock_fs.basename = lambda p: Path(p).name
-        mock_fs.stem = lambda p: Path(p).stem
-        mock_fs.exists = AsyncMock(return_value=False)
-
-        scanner = GameScanner(mock_fs)
+        fs = FakeFS(["/games/PS2ISO/game.iso"])
+
+        scanner = GameScanner(fs)
         games = []
 
         async for game in scanner.scan_root("/games"):
@@ -224,35 +302,9 @@ class TestGameScanner:
 
     async def test_scan_with_existing_cover(self):
         """Test detecting existing covers."""
-        mock_fs = AsyncMock(spec=LocalFilesystem)
-
-        async def mock_list_dir_impl(path):
-            if path == "/games":
-                folder = MagicMock()
-                folder.name = "PSXISO"
-                folder.path = "/games/PSXISO"
-                folder.is_dir = True
-                yield folder
-            elif path == "/games/PSXISO":
-                game_file = MagicMock()
-                game_file.name = "game.bin"
-                game_file.path = "/games/PSXISO/game.bin"
-                game_file.is_dir = False
-                yield game_file
-
-                cover_file = MagicMock()
-                cover_file.name = "game.PNG"
-                cover_file.path = "/games/PSXISO/game.PNG"
-                cover_file.is_dir = False
-                yield cover_file
-
-        mock_fs.list_dir = mock_list_dir_impl
-        mock_fs.dirname = lambda p: str(Path(p).parent)
-        mock_fs.basename = lambda p: Path(p).name
-        mock_fs.stem = lambda p: Path(p).stem
-        mock_fs.exists = AsyncMock(return_value=False)
-
-        scanner = GameScanner(mock_fs)
+        fs = FakeFS(["/games/PSXISO/game.bin", "/games/PSXISO/game.PNG"])
+
+        scanner = GameScanner(fs)
         games = []
 
         async for game in scanner.scan_root("/games"):
@@ -262,6 +314,41 @@ class TestGameScanner:
         assert games[0].has_cover is True
         assert games[0].cover_path == "/games/PSXISO/game.PNG"
 
+    async def test_scan_rom_cover_from_listing(self):
+        """Test ROM covers are found from the directory listing without exists() calls."""
+        fs = FakeFS(
+            [
+                "/games/ROMS/snes/mario.sfc",
+                "/games/ROMS/snes/mario.png",
+                "/games/ROMS/snes/zelda.sfc",
+            ]
+        )
+
+        scanner = GameScanner(fs)
+        games = {game.name: game async for game in scanner.scan_root("/games")}
+
+        assert games["mario"].platform == "SNES"
+        assert games["mario"].cover_path == "/games/ROMS/snes/mario.png"
+        assert games["zelda"].has_cover is False
+        assert fs.calls["exists"] == 0
+
+    async def test_scan_nested_folders_keeps_order(self, tmp_path):
+        """Test concurrent folder walking yields games in depth-first order."""
+        for folder in ("PS2ISO/B/Beta", "PS2ISO/A", "PS2ISO/C"):
+            (tmp_path / folder).mkdir(parents=True)
+        (tmp_path / "PS2ISO/B/Beta/beta.iso").write_bytes(b"")
+        (tmp_path / "PS2ISO/A/alpha.iso").write_bytes(b"")
+        (tmp_path / "PS2ISO/C/gamma.iso").write_bytes(b"")
+        (tmp_path / "PS2ISO/root.iso").write_bytes(b"")
+
+        scanner = GameScanner(LocalFilesystem(), max_workers=2)
+        names = [game.name async for game in scanner.scan_root(str(tmp_path))]
+        expected = [game.name async for game in GameScanner(LocalFilesystem(), max_workers=1).scan_root(str(tmp_path))]
+
+        assert sorted(names) == ["alpha", "beta", "gamma", "root"]
+        assert names == expected
+        assert names[-1] == "root"
+
 
 @pytest.mark.asyncio
 class TestSerialResolver:
@@ -316,3 +403,31 @@ class TestSerialResolver:
         )
 
         assert result is None
+
+    async def test_resolve_caches_results(self):
+        """Test repeated lookups are answered without re-running fuzzy matching."""
+        db = MagicMock(spec=RomDatabase)
+        db.find_serial.return_value = ("SLUS-21001", 95.0)
+        resolver = SerialResolver({"PS2": db})
+
+        first = await resolver.resolve("Gran Turismo 4.iso", platform="PS2")
+        second = await resolver.resolve("Gran Turismo 4.iso", platform="PS2")
+
+        assert first == second == ("SLUS-21001", "fuzzy_region")
+        assert db.find_serial.call_count == 1
+
+
+class TestScanCache:
+    """Test on-disk serial cache for rescans."""
+
+    def test_lookup_requires_unchanged_file(self, tmp_path):
+        """Test cached serials are only reused while mtime and size match."""
+        game = GameFile("/PS2ISO/gt4.iso", "gt4", "PS2", "/PS2ISO", [".iso"], False, None, size=10, mtime=5)
+        touched = GameFile("/PS2ISO/gt4.iso", "gt4", "PS2", "/PS2ISO", [".iso"], False, None, size=10, mtime=6)
+
+        with ScanCache(tmp_path / "scan.sqlite") as cache:
+            cache.store([(game, ("SLUS-21001", "fuzzy_region"))])
+
+        with ScanCache(tmp_path / "scan.sqlite") as cache:
+            assert cache.lookup([game]) == {"/PS2ISO/gt4.iso": ("SLUS-21001", "fuzzy_region")}
+            assert cache.lookup([touched]) == {}
@@ -1,7 +1,9 @@
 """Tests for cryptographic operations."""
 
+from ps3toolbox.core.crypto import CBC_INTO_SLACK
 from ps3toolbox.core.crypto import aes128_cbc_decrypt
 from ps3toolbox.core.crypto import aes128_cbc_encrypt
+from ps3toolbox.core.crypto import aes128_cbc_encrypt_into
 from ps3toolbox.core.crypto import calculate_omac
 from ps3toolbox.core.crypto import calculate_sha1
 from ps3toolbox.core.crypto import derive_keys
@@ -23,6 +25,18 @@ def test_aes_encryption_decryption_roundtrip():
     assert encrypted != original_data
 
 
+def test_aes_encrypt_into_matches_encrypt():
+    """Test encrypting into a buffer writes the same ciphertext."""
+    key = bytes(range(16))
+    data = b"Test data here!!" * 16
+    dst = bytearray(len(data) + CBC_INTO_SLACK)
+
+    written = aes128_cbc_encrypt_into(key, bytes(16), memoryview(data), dst)
+
+    assert written == len(data)
+    assert dst[:written] == aes128_cbc_encrypt(key, bytes(16), data)
+
+
 def test_derive_keys():
     """Test key derivation produces deterministic results."""
     data_key, meta_key = derive_keys(PS2_KEY_CEX_DATA, PS2_KEY_CEX_META, PS2_PLACEHOLDER_KLIC)
@@ -0,0 +1,42 @@
+"""Tests for direct I/O helpers used by encrypt/decrypt."""
+
+from ps3toolbox.utils.direct_io import aligned_buffer
+from ps3toolbox.utils.direct_io import open_reader
+from ps3toolbox.utils.direct_io import open_writer
+from ps3toolbox.utils.direct_io import read_into
+
+
+def test_read_into_returns_partial_view_at_eof(tmp_path):
+    """Test reading a file shorter than the buffer."""
+    path = tmp_path / "data.bin"
+    path.write_bytes(b"\xab" * 0x5000)
+
+    buffer = aligned_buffer(0x4000)
+    with open_reader(path) as f:
+        first = bytes(read_into(f, buffer))
+        second = bytes(read_into(f, buffer))
+        third = read_into(f, buffer)
+
+    assert first == b"\xab" * 0x4000
+    assert second == b"\xab" * 0x1000
+    assert len(third) == 0
+
+
+def test_open_reader_buffered_fallback(tmp_path):
+    """Test reading with direct I/O disabled."""
+    path = tmp_path / "data.bin"
+    path.write_bytes(b"test" * 1024)
+
+    with open_reader(path, direct_io=False) as f:
+        assert bytes(read_into(f, aligned_buffer(0x1000))) == b"test" * 1024
+
+
+def test_open_writer_truncates_preallocation(tmp_path):
+    """Test pre-allocated output is trimmed to bytes actually written."""
+    path = tmp_path / "out.bin"
+
+    with open_writer(path, 0x10000) as f:
+        f.write(b"\x01" * 0x100)
+        f.truncate()
+
+    assert path.read_bytes() == b"\x01" * 0x100
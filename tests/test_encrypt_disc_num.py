@@ -1,9 +1,11 @@
 """Unit tests for disc_num parameter in PS2 encryption."""
 
+import os
 from unittest.mock import patch
 
 import pytest
 
+from ps3toolbox.ps2.encrypt import CHUNK_SIZE
 from ps3toolbox.ps2.encrypt import encrypt_ps2_iso
 
 
@@ -116,3 +118,39 @@ class TestDiscNumParameter:
         except ValueError as e:
             if "Disc number" in str(e):
                 pytest.fail(f"Default disc_num should be valid: {e}")
+
+
+class TestParallelEncrypt:
+    """Test chunk-parallel encryption."""
+
+    @patch("ps3toolbox.ps2.encrypt.add_limg_header")
+    @patch("ps3toolbox.ps2.encrypt.pad_iso_to_boundary")
+    @patch("ps3toolbox.ps2.encrypt.validate_iso")
+    def test_workers_match_serial_output(self, mock_validate, mock_pad, mock_limg, tmp_path):
+        """Test a multi-chunk image encrypts identically with a process pool."""
+        iso_file = tmp_path / "test.iso"
+        test_data = os.urandom(CHUNK_SIZE * 2 + 0x4000 * 3)
+        iso_file.write_bytes(test_data)
+        mock_limg.return_value = len(test_data)
+
+        encrypt_ps2_iso(iso_file, tmp_path / "serial.bin.enc", disc_num=2)
+        encrypt_ps2_iso(iso_file, tmp_path / "parallel.bin.enc", disc_num=2, workers=2)
+
+        assert (tmp_path / "parallel.bin.enc").read_bytes() == (tmp_path / "serial.bin.enc").read_bytes()
+
+
+class TestInPlaceEncrypt:
+    """Test encrypting without a temporary copy."""
+
+    @patch("ps3toolbox.ps2.encrypt.build_ps2_header", side_effect=RuntimeError("boom"))
+    @patch("ps3toolbox.ps2.encrypt.validate_iso")
+    def test_failure_restores_source(self, mock_validate, mock_header, tmp_path):
+        """Test a failed in-place run truncates the padded, LIMG-tagged source back."""
+        iso_file = tmp_path / "test.iso"
+        test_data = os.urandom(0x10000 + 0x800)
+        iso_file.write_bytes(test_data)
+
+        with pytest.raises(RuntimeError, match="boom"):
+            encrypt_ps2_iso(iso_file, tmp_path / "test.bin.enc", use_temp=False)
+
+        assert iso_file.read_bytes() == test_data
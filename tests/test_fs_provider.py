@@ -0,0 +1,369 @@
+"""Tests for filesystem providers."""
+
+import asyncio
+import os
+from ftplib import error_perm
+from ftplib import error_temp
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import pytest
+
+from ps3toolbox.utils.fs import FTPFilesystem
+from ps3toolbox.utils.fs import LocalFilesystem
+
+
+@pytest.mark.asyncio
+class TestLocalFilesystem:
+    """Test local filesystem provider."""
+
+    async def test_read_write_roundtrip(self, tmp_path):
+        """Test writing bytes and reading them back, including a range."""
+        fs = LocalFilesystem()
+        path = str(tmp_path / "file.bin")
+
+        await fs.write_bytes(path, b"0123456789")
+
+        assert await fs.read_bytes(path) == b"0123456789"
+        assert await fs.read_bytes(path, start=2, length=3) == b"234"
+
+    async def test_stream_roundtrip(self, tmp_path):
+        """Test streaming chunks to a file and reading a range back in chunks."""
+        fs = LocalFilesystem()
+        path = str(tmp_path / "file.bin")
+        data = os.urandom(3_000_000)
+
+        async def chunks():
+            for i in range(0, len(data), 700_000):
+                yield data[i : i + 700_000]
+
+        await fs.write_stream(path, chunks())
+
+        assert b"".join([c async for c in fs.read_stream(path)]) == data
+        assert b"".join([c async for c in fs.read_stream(path, start=10, length=2_000_000)]) == data[10:2_000_010]
+
+    async def test_list_dir(self, tmp_path):
+        """Test listing reports sizes for files and flags directories."""
+        fs = LocalFilesystem()
+        (tmp_path / "game.iso").write_bytes(b"1234")
+        (tmp_path / "covers").mkdir()
+
+        items = sorted([item async for item in fs.list_dir(str(tmp_path))], key=lambda i: i.name)
+
+        assert [(i.name, i.size, i.is_dir) for i in items] == [("covers", 0, True), ("game.iso", 4, False)]
+        assert items[1].path == str(tmp_path / "game.iso")
+        assert [item async for item in fs.list_dir(str(tmp_path / "missing"))] == []
+
+    async def test_copy_file_preserves_content_and_mtime(self, tmp_path):
+        """Test copying a file keeps its bytes and modification time."""
+        fs = LocalFilesystem()
+        src = tmp_path / "src.bin"
+        dst = tmp_path / "dst.bin"
+        src.write_bytes(os.urandom(300_000))
+        os.utime(src, (1_000_000, 2_000_000))
+
+        await fs.copy_file(str(src), str(dst))
+
+        assert dst.read_bytes() == src.read_bytes()
+        assert dst.stat().st_mtime == 2_000_000
+
+    async def test_path_helpers_match_pathlib(self):
+        """Test string-based path helpers agree with pathlib."""
+        fs = LocalFilesystem()
+        cases = [("/games/PS2ISO", "Game.png"), ("games/", "./Game", ""), ("/", "a//b/."), ("", "x")]
+
+        for parts in cases:
+            assert fs.join_path(*parts) == str(Path(*parts))
+        paths = ["/games/PS2ISO/Game.iso", "/games/PS2ISO/", "a/./b", "a/b/.", "./a", "a//b", "/", "", "a", "/a"]
+        for path in paths:
+            assert fs.dirname(path) == str(Path(path).parent)
+            assert fs.basename(path) == Path(path).name
+        assert fs.stem("/games/Game.v2.iso") == Path("/games/Game.v2.iso").stem
+
+    async def test_dry_run_skips_writes(self, tmp_path):
+        """Test dry-run mode leaves the filesystem untouched."""
+        fs = LocalFilesystem(dry_run=True)
+        path = tmp_path / "file.bin"
+
+        await fs.write_bytes(str(path), b"data")
+        await fs.mkdir(str(tmp_path / "folder"))
+
+        assert not path.exists()
+        assert not (tmp_path / "folder").exists()
+
+
+@pytest.mark.asyncio
+class TestFTPFilesystem:
+    """Test FTP provider session pooling."""
+
+    async def test_pool_reuses_and_caps_sessions(self):
+        """Test concurrent operations share at most pool_size sessions."""
+        fs = FTPFilesystem("localhost", pool_size=2)
+        opened = []
+
+        def open_connection():
+            client = MagicMock()
+            client.size.return_value = 1
+            opened.append(client)
+            return client
+
+        fs._open_connection = open_connection
+
+        results = await asyncio.gather(*(fs.exists(f"/file{i}") for i in range(6)))
+        await fs.exists("/file")
+
+        assert all(results)
+        assert 1 <= len(opened) <= 2
+
+    async def test_concurrent_copies_do_not_deadlock(self):
+        """Test pool_size concurrent streaming copies all finish."""
+        fs = FTPFilesystem("localhost", pool_size=4)
+        stored = {}
+
+        def open_connection():
+            client = MagicMock()
+            client.retrbinary.side_effect = lambda cmd, callback, blocksize, rest=None: [
+                callback(chunk) for chunk in (b"ab", b"cd")
+            ]
+
+            def storbinary(cmd, fp, blocksize):
+                stored[cmd] = b"".join(iter(lambda: fp.read(blocksize), b""))
+
+            client.storbinary.side_effect = storbinary
+            return client
+
+        fs._open_connection = open_connection
+
+        copies = (fs.copy_file(f"/src{i}.iso", f"/dst{i}.iso") for i in range(fs.pool_size))
+        await asyncio.wait_for(asyncio.gather(*copies), timeout=5)
+
+        assert stored == {f"STOR dst{i}.iso": b"abcd" for i in range(4)}
+
+    async def test_copy_missing_source_raises_without_upload(self):
+        """Test a copy from a missing file raises the server error and never sends STOR."""
+        fs = FTPFilesystem("localhost", pool_size=2)
+        client = MagicMock()
+        client.retrbinary.side_effect = error_perm("550 No such file")
+        fs._open_connection = lambda: client
+
+        with pytest.raises(error_perm):
+            await fs.copy_file("/missing.iso", "/copy.iso")
+
+        client.storbinary.assert_not_called()
+
+    async def test_failed_copy_returns_sessions_to_pool(self):
+        """Test a copy whose STOR fails closes its download and frees both sessions."""
+        fs = FTPFilesystem("localhost", pool_size=4)
+
+        def open_connection():
+            client = MagicMock()
+            client.retrbinary.side_effect = lambda cmd, callback, blocksize, rest=None: [
+                callback(b"abcd") for _ in range(1000)
+            ]
+            client.storbinary.side_effect = error_perm("553 Could not create file")
+            return client
+
+        fs._open_connection = open_connection
+
+        for i in range(fs.pool_size):
+            with pytest.raises(error_perm):
+                await asyncio.wait_for(fs.copy_file("/src.iso", f"/dst{i}.iso"), timeout=5)
+
+        async def pool_drained():
+            while fs._slots._value < fs.pool_size:
+                await asyncio.sleep(0.01)
+
+        await asyncio.wait_for(pool_drained(), timeout=5)
+        assert await asyncio.wait_for(fs.exists("/src.iso"), timeout=5)
+
+    async def test_read_stream_early_aclose_releases_session(self):
+        """Test closing a partly read stream stops the download and pools its session again."""
+        fs = FTPFilesystem("localhost", pool_size=1)
+        client = MagicMock()
+        client.retrbinary.side_effect = lambda cmd, callback, blocksize, rest=None: [
+            callback(b"abcd") for _ in range(1000)
+        ]
+        opened = []
+        fs._open_connection = lambda: opened.append(client) or client
+
+        stream = fs.read_stream("/game.iso")
+        assert await anext(stream) == b"abcd"
+        await stream.aclose()
+
+        assert fs._slots._value == fs.pool_size
+        assert await asyncio.wait_for(fs.read_bytes("/game.iso", length=2), timeout=5) == b"ab"
+        assert len(opened) == 1
+        client.close.assert_not_called()
+
+    async def test_write_stream_source_failure_removes_partial_file(self):
+        """Test a source failing mid-upload re-raises its error and deletes the partial file."""
+        fs = FTPFilesystem("localhost")
+        client = MagicMock()
+        received = []
+
+        def storbinary(cmd, fp, blocksize):
+            while chunk := fp.read(blocksize):
+                received.append(chunk)
+
+        client.storbinary.side_effect = storbinary
+        fs._open_connection = lambda: client
+
+        async def chunks():
+            yield b"abcd"
+            raise ValueError("source failed")
+
+        with pytest.raises(ValueError, match="source failed"):
+            await fs.write_stream("/games/game.iso", chunks())
+
+        assert received == [b"abcd"]
+        client.getresp.assert_called_once()
+        client.delete.assert_called_once_with("/games/game.iso")
+
+    async def test_listing_cache_answers_exists(self):
+        """Test cached listings serve exists/is_dir and are invalidated by writes."""
+        fs = FTPFilesystem("localhost")
+        client = MagicMock()
+        client.mlsd.return_value = [("game.iso", {"type": "file", "size": "4"}), ("sub", {"type": "dir"})]
+        fs._open_connection = lambda: client
+
+        first = [item.name async for item in fs.list_dir("/games")]
+        second = [item.name async for item in fs.list_dir("/games/")]
+
+        assert first == second == ["game.iso", "sub"]
+        assert client.mlsd.call_count == 1
+        assert await fs.exists("/games/game.iso")
+        assert not await fs.exists("/games/other.iso")
+        assert await fs.is_dir("/games/sub")
+        client.size.assert_not_called()
+
+        await fs.write_bytes("/games/new.iso", b"data")
+        [item async for item in fs.list_dir("/games")]
+
+        assert client.mlsd.call_count == 2
+
+    async def test_list_dir_parses_list_without_size_probes(self):
+        """Test the MLSD fallback reads sizes from LIST instead of per-file SIZE."""
+        fs = FTPFilesystem("localhost")
+        client = MagicMock()
+        client.mlsd.side_effect = error_perm("500 MLSD not understood")
+        lines = [
+            "total 2",
+            "-rw-r--r--   1 root  root  123456 Jan 01 12:00 My Game.iso",
+            "drwxrwxrwx   1 root  root       0 Dec 31  2023 PS3ISO",
+            "-rw-r--r--   1 root  root       5 Jan 01 12:00  Spaced.iso",
+        ]
+        client.retrlines.side_effect = lambda cmd, callback: [callback(line) for line in lines]
+        fs._open_connection = lambda: client
+
+        items = [item async for item in fs.list_dir("/dev_hdd0")]
+
+        assert [(i.path, i.size, i.is_dir) for i in items] == [
+            ("/dev_hdd0/My Game.iso", 123456, False),
+            ("/dev_hdd0/PS3ISO", 0, True),
+            ("/dev_hdd0/ Spaced.iso", 5, False),
+        ]
+        client.size.assert_not_called()
+        client.nlst.assert_not_called()
+
+    async def test_run_retries_once_on_dropped_session(self):
+        """Test a session closed by the server is replaced without a NOOP per call."""
+        fs = FTPFilesystem("localhost")
+        stale, fresh = MagicMock(), MagicMock()
+        stale.size.side_effect = EOFError
+        sessions = iter([stale, fresh])
+        fs._open_connection = lambda: next(sessions)
+
+        assert await fs.exists("/game.iso")
+        assert await fs.exists("/other.iso")
+
+        stale.close.assert_called_once()
+        fresh.voidcmd.assert_not_called()
+
+    async def test_run_does_not_retry_mutations(self):
+        """Test a rename on a dropped session fails instead of being sent again."""
+        fs = FTPFilesystem("localhost")
+        stale, fresh = MagicMock(), MagicMock()
+        stale.rename.side_effect = EOFError
+        sessions = iter([stale, fresh])
+        fs._open_connection = lambda: next(sessions)
+
+        with pytest.raises(EOFError):
+            await fs.rename("/old.iso", "/new.iso")
+
+        stale.rename.assert_called_once_with("/old.iso", "/new.iso")
+        fresh.rename.assert_not_called()
+
+    async def test_read_bytes_range_aborts_transfer(self):
+        """Test a ranged read stops the download once enough bytes arrived."""
+        fs = FTPFilesystem("localhost")
+        client = MagicMock()
+        sent = []
+
+        def retrbinary(cmd, callback, blocksize, rest=None):
+            for chunk in (b"abcd", b"efgh", b"ijkl"):
+                sent.append(chunk)
+                callback(chunk)
+
+        client.retrbinary.side_effect = retrbinary
+        fs._open_connection = lambda: client
+
+        assert await fs.read_bytes("/game.iso", start=2, length=6) == b"abcdef"
+        assert sent == [b"abcd", b"efgh"]
+        assert client.retrbinary.call_args.kwargs["rest"] == 2
+        client.getresp.assert_called_once()
+
+    async def test_aborted_read_keeps_session_after_426(self):
+        """Test a 426 reply to an aborted download leaves the session pooled."""
+        fs = FTPFilesystem("localhost")
+        client = MagicMock()
+        client.retrbinary.side_effect = lambda cmd, callback, blocksize, rest=None: [
+            callback(chunk) for chunk in (b"abcd", b"efgh")
+        ]
+        client.getresp.side_effect = error_temp("426 Connection closed; transfer aborted")
+        opened = []
+        fs._open_connection = lambda: opened.append(client) or client
+
+        assert await fs.read_bytes("/game.iso", length=2) == b"ab"
+        assert await fs.read_bytes("/game.iso", length=2) == b"ab"
+
+        client.close.assert_not_called()
+        assert len(opened) == 1
+
+    async def test_zero_length_reads_whole_file(self):
+        """Test length=0 means the whole file, as for local reads."""
+        fs = FTPFilesystem("localhost")
+        client = MagicMock()
+        client.retrbinary.side_effect = lambda cmd, callback, blocksize, rest=None: [
+            callback(chunk) for chunk in (b"abcd", b"efgh")
+        ]
+        fs._open_connection = lambda: client
+
+        assert await fs.read_bytes("/game.iso", length=0) == b"abcdefgh"
+        assert b"".join([chunk async for chunk in fs.read_stream("/game.iso", length=0)]) == b"abcdefgh"
+        client.getresp.assert_not_called()
+
+
+class TestFTPStreamShutdown:
+    """Test streams left open when their event loop shuts down."""
+
+    def test_abandoned_stream_closes_cleanly_at_shutdown(self):
+        """Test asyncio finalizing a partly read stream releases its session without errors."""
+        fs = FTPFilesystem("localhost", pool_size=1)
+        client = MagicMock()
+        client.retrbinary.side_effect = lambda cmd, callback, blocksize, rest=None: [
+            callback(b"abcd") for _ in range(1000)
+        ]
+        fs._open_connection = lambda: client
+        errors = []
+        abandoned = []
+
+        async def main():
+            asyncio.get_running_loop().set_exception_handler(lambda loop, context: errors.append(context))
+            stream = fs.read_stream("/game.iso")
+            await anext(stream)
+            abandoned.append(stream)
+
+        asyncio.run(main())
+
+        assert errors == []
+        assert fs._slots._value == fs.pool_size
@@ -28,6 +28,7 @@ def test_pad_iso_to_boundary(tmp_path):
 
     assert new_size % 0x1000 == 0
     assert new_size == original_size + padding_added
+    assert iso_file.read_bytes()[original_size:] == bytes(padding_added)
 
 
 def test_pad_iso_already_aligned(tmp_path):